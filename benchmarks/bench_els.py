@@ -0,0 +1,76 @@
+"""
+Benchmarks for searching a term as an equidistant letter sequence in a Torah sized letter stream (~300 thousand
+letters), at every skip up to 2,000 in both directions.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_els
+"""
+
+import timeit
+
+from hebrew.els import ELSMatch, ELSText
+from tests.test_hebrew import taamei_hamikra
+
+LETTERS_IN_TORAH = 300_000
+SAMPLE = ELSText(" ".join(taamei_hamikra)).letters
+ELS = ELSText((SAMPLE * (LETTERS_IN_TORAH // len(SAMPLE) + 1))[:LETTERS_IN_TORAH])
+TERM = "תורה"
+MAX_SKIP = 2000
+
+
+def naive(letters: str, term: str, max_skip: int) -> list:
+    """How a skip search is usually written; every letter of the text is a candidate start, at every skip."""
+    matches = []
+    for skip in range(1, max_skip + 1):
+        for signed in (skip, -skip):
+            for start in range(len(letters)):
+                end = start + (len(term) - 1) * signed
+                if 0 <= end < len(letters) and all(
+                    letters[start + i * signed] == letter
+                    for i, letter in enumerate(term)
+                ):
+                    matches.append(ELSMatch(start, signed, len(term)))
+    return matches
+
+
+def report(name: str, func, number: int = 1) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{name:<45} {seconds * 1000:>10.1f} ms")
+    return seconds
+
+
+def main():
+    matches = ELS.search(TERM, max_skip=MAX_SKIP)
+    print(
+        f"Text: {len(ELS):,} letters, {len(matches):,} matches of {TERM} with skips up to {MAX_SKIP}\n"
+    )
+    assert ELS.search(TERM, max_skip=MAX_SKIP, use_numpy=False) == matches
+    # The naive search takes minutes for all skips, so it is compared on the first few.
+    naive_skips = 5
+    assert naive(ELS.letters, TERM, naive_skips) == ELS.search(
+        TERM, max_skip=naive_skips
+    )
+
+    before = report(
+        f"naive, skips up to {naive_skips} (before)",
+        lambda: naive(ELS.letters, TERM, naive_skips),
+    )
+    before *= MAX_SKIP / naive_skips
+    print(
+        f"{'naive, extrapolated to all skips (before)':<45} {before * 1000:>10.1f} ms"
+    )
+    regex = report(
+        "ELSText.search, regular expressions (after)",
+        lambda: ELS.search(TERM, max_skip=MAX_SKIP, use_numpy=False),
+    )
+    vectors = report(
+        "ELSText.search, numpy (after)",
+        lambda: ELS.search(TERM, max_skip=MAX_SKIP, use_numpy=True),
+    )
+    print(f"{'speedup, regular expressions':<45} {before / regex:>10.1f} x")
+    print(f"{'speedup, numpy':<45} {before / vectors:>10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmarks for the gematria calculations on a Tanakh sized text (~1.2 million letters).
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_gematria
+"""
+
+import timeit
+
+from hebrew.chars import HEBREW_CHARS
+from hebrew.gematria import (
+    GematriaTypes,
+    _GEMATRIA_CHARS,
+    calculate_gematria,
+    calculate_gematria_all,
+    gematria_by_word,
+)
+
+VERSE = "בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים אֵ֥ת הַשָּׁמַ֖יִם וְאֵ֥ת הָאָֽרֶץ׃ "
+LETTERS_IN_TANAKH = 1_200_000
+TEXT = VERSE * (LETTERS_IN_TANAKH // 28)
+
+
+def clean_rebuilding_list(string: str) -> str:
+    """How strings were cleaned before; the list of letters is rebuilt for every character."""
+    return "".join(
+        [c for c in string if c in [x.char for x in HEBREW_CHARS] or c == " "]
+    )
+
+
+def clean_frozenset(string: str) -> str:
+    """How strings are cleaned now; a single lookup in a module level frozenset."""
+    return "".join(filter(_GEMATRIA_CHARS.__contains__, string))
+
+
+def boneeh_quadratic(string: str) -> int:
+    """How MISPAR_BONEEH was calculated before; the sum of all previous letters is recalculated for every letter."""
+    values = [calculate_gematria(c) for c in clean_frozenset(string) if c != " "]
+    total = 0
+    for i, n in enumerate(values):
+        total += sum(values[:i]) + n
+    return total
+
+
+def report(name: str, func, number: int = 1) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{name:<45} {seconds * 1000:>10.1f} ms")
+    return seconds
+
+
+def main():
+    letters = sum(1 for c in TEXT if c in _GEMATRIA_CHARS and c != " ")
+    print(f"Text length: {len(TEXT):,} characters, {letters:,} letters\n")
+
+    before = report(
+        "clean, rebuilding list (before)", lambda: clean_rebuilding_list(TEXT)
+    )
+    after = report("clean, frozenset (after)", lambda: clean_frozenset(TEXT))
+    print(f"{'speedup':<45} {before / after:>10.1f} x\n")
+
+    assert clean_rebuilding_list(TEXT) == clean_frozenset(TEXT)
+
+    for method in (
+        GematriaTypes.MISPAR_HECHRACHI,
+        GematriaTypes.MISPAR_MUSAFI,
+        GematriaTypes.MISPAR_KOLEL,
+        GematriaTypes.MISPAR_KATAN_MISPARI,
+    ):
+        report(method.name, lambda: calculate_gematria(TEXT, method))
+
+    chapter = VERSE * 100
+    print(f"\nChapter length: {len(chapter):,} characters\n")
+    before = report(
+        "MISPAR_BONEEH, quadratic (before)", lambda: boneeh_quadratic(chapter)
+    )
+    after = report(
+        "MISPAR_BONEEH, running sum (after)",
+        lambda: calculate_gematria(chapter, GematriaTypes.MISPAR_BONEEH),
+        number=10,
+    )
+    print(f"{'speedup':<45} {before / after:>10.1f} x")
+
+    assert boneeh_quadratic(chapter) == calculate_gematria(
+        chapter, GematriaTypes.MISPAR_BONEEH
+    )
+
+    print(f"\nAll {len(GematriaTypes)} methods for a verse\n")
+    before = report(
+        "each method separately",
+        lambda: {m: calculate_gematria(VERSE, m) for m in GematriaTypes},
+        number=1000,
+    )
+    after = report(
+        "calculate_gematria_all", lambda: calculate_gematria_all(VERSE), number=1000
+    )
+    print(f"{'speedup':<45} {before / after:>10.1f} x")
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("\nNumPy is not installed, skipping the vectorized benchmark.")
+        return
+    print("\nGematria of every word in the text\n")
+    before = report(
+        "gematria_by_word, python",
+        lambda: gematria_by_word(TEXT, use_numpy=False),
+    )
+    after = report("gematria_by_word, numpy", lambda: gematria_by_word(TEXT))
+    print(f"{'speedup':<45} {before / after:>10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmarks for equivalence searches ("what else equals 26?") over a Tanakh sized corpus (~300 thousand words).
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_gematria_index
+"""
+
+import os
+import tempfile
+import timeit
+
+from hebrew import Hebrew
+from hebrew.gematria_index import GematriaIndex, MappedGematriaIndex
+from tests.test_hebrew import taamei_hamikra
+
+WORDS_IN_TANAKH = 300_000
+WORDS = [w for p in taamei_hamikra for w in Hebrew(p).iter_words(as_str=True)]
+CORPUS = [WORDS[i % len(WORDS)] for i in range(WORDS_IN_TANAKH)]
+
+
+def brute_force(value: int) -> list:
+    """How searches were done before; the gematria of every word is calculated for each query."""
+    return [i for i, w in enumerate(CORPUS) if Hebrew(w).gematria() == value]
+
+
+def report(name: str, func, number: int = 1) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{name:<45} {seconds * 1000:>10.3f} ms")
+    return seconds
+
+
+def main():
+    print(f"Corpus: {len(CORPUS):,} words, {len(set(CORPUS)):,} distinct\n")
+    index = GematriaIndex()
+    report("build the index", lambda: index.add_words(CORPUS))
+    index = GematriaIndex()
+    index.add_words(CORPUS)
+    value = index.value(index.add_words(["אֱלֹהִים"])[0])
+    assert [p.location for p in index.find(value)][:-1] == brute_force(value)
+
+    print(f"\nFind all words equal to {value}\n")
+    before = report("brute force (before)", lambda: brute_force(value))
+    after = report("GematriaIndex.find (after)", lambda: index.find(value), 1000)
+    print(f"{'speedup':<45} {before / after:>10.1f} x\n")
+
+    report("GematriaIndex.find_texts", lambda: index.find_texts(value), 1000)
+    report("GematriaIndex.find_range(50, 60)", lambda: index.find_range(50, 60), 100)
+
+    print("\nStarting up from an index file\n")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tanakh.idx")
+        index.save(path)
+        print(f"{'file size':<45} {os.path.getsize(path) / 1024 / 1024:>10.1f} MiB")
+        before = report(
+            "rebuild the index (before)", lambda: GematriaIndex().add_words(CORPUS)
+        )
+        after = report(
+            "open the mapped index (after)",
+            lambda: MappedGematriaIndex(path).close(),
+            100,
+        )
+        print(f"{'speedup':<45} {before / after:>10.1f} x\n")
+        with MappedGematriaIndex(path) as mapped:
+            assert mapped.find(value) == index.find(value)
+            report("MappedGematriaIndex.find", lambda: mapped.find(value), 100)
+
+
+if __name__ == "__main__":
+    main()
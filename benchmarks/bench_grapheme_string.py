@@ -0,0 +1,67 @@
+"""
+Benchmarks for repeated grapheme operations on the same verse, as done by a renderer.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_grapheme_string
+"""
+
+import timeit
+
+import grapheme
+
+from hebrew import GraphemeString
+from hebrew.grapheme_string import _grapheme_lengths
+
+VERSE = "וְהָאָ֗רֶץ הָיְתָ֥ה תֹ֙הוּ֙ וָבֹ֔הוּ וְחֹ֖שֶׁךְ עַל־פְּנֵ֣י תְה֑וֹם וְר֣וּחַ אֱלֹהִ֔ים מְרַחֶ֖פֶת עַל־פְּנֵ֥י הַמָּֽיִם׃ "
+STRING = GraphemeString(VERSE * 10)
+BOOK = VERSE * 2000
+
+
+def uncached(string: str) -> list:
+    """How repeated calls worked before; the string is segmented again by every call."""
+    length = grapheme.length(string)
+    return [grapheme.slice(string, i, i + 5) for i in range(0, length, 5)]
+
+
+def cached(string: GraphemeString) -> list:
+    """How repeated calls work now; the grapheme boundaries are found once and reused."""
+    return [string.slice(i, i + 5) for i in range(0, string.length, 5)]
+
+
+def report(name: str, func, number: int = 1) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{name:<45} {seconds * 1000:>10.3f} ms")
+    return seconds
+
+
+def main():
+    print(
+        f"Text length: {len(STRING.string):,} characters, {STRING.length:,} graphemes\n"
+    )
+    assert uncached(STRING.string) == cached(STRING)
+
+    print("Slicing the text into 5 grapheme pieces\n")
+    before = report("grapheme.slice (before)", lambda: uncached(STRING.string))
+    after = report("GraphemeString.slice (after)", lambda: cached(STRING), number=10)
+    print(f"{'speedup':<45} {before / after:>10.1f} x\n")
+
+    before = report(
+        "grapheme.length (before)", lambda: grapheme.length(STRING.string), number=10
+    )
+    after = report("GraphemeString.length (after)", lambda: STRING.length, number=1000)
+    print(f"{'speedup':<45} {before / after:>10.1f} x\n")
+
+    print(f"Segmenting {len(BOOK):,} characters of vocalized text\n")
+    assert list(_grapheme_lengths(BOOK)) == list(grapheme.grapheme_lengths(BOOK))
+    before = report(
+        "grapheme library (before)", lambda: list(grapheme.grapheme_lengths(BOOK))
+    )
+    after = report(
+        "hebrew segmenter (after)", lambda: list(_grapheme_lengths(BOOK)), number=10
+    )
+    print(f"{'speedup':<45} {before / after:>10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
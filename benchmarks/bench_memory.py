@@ -0,0 +1,41 @@
+"""
+Memory used by a million `Hebrew` word objects.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_memory
+"""
+
+import tracemalloc
+
+from hebrew import Hebrew
+
+WORDS = "בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים אֵ֥ת הַשָּׁמַ֖יִם וְאֵ֥ת הָאָֽרֶץ׃".split()
+NUMBER_OF_WORDS = 1_000_000
+
+
+class HebrewWithDict(Hebrew):
+    """How `Hebrew` was laid out before; any subclass without `__slots__` gets a `__dict__` again."""
+
+
+def measure(name: str, cls) -> int:
+    # The strings are shared, so only the objects themselves are measured.
+    strings = [WORDS[i % len(WORDS)] for i in range(NUMBER_OF_WORDS)]
+    tracemalloc.start()
+    objects = [cls(s) for s in strings]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    print(f"{name:<45} {size / 1024 / 1024:>10.1f} MiB")
+    return size
+
+
+def main():
+    print(f"{NUMBER_OF_WORDS:,} words\n")
+    before = measure("Hebrew with __dict__ (before)", HebrewWithDict)
+    after = measure("Hebrew with __slots__ (after)", Hebrew)
+    print(f"{'saved':<45} {(before - after) / before:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmarks for converting the chapter, verse and page numbers of a corpus (1 to 1,000, repeated) to Hebrew letters,
+and for applying the substitutions to the unpunctuated form of each number.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_numerical_conversion
+"""
+
+import timeit
+
+from hebrew.numerical_conversion.convert import (
+    number_to_hebrew_string,
+    set_number_cache_limit,
+)
+from hebrew.numerical_conversion.substitute import (
+    CompiledSubstitutions,
+    Substitutions,
+)
+
+NUMBERS = [i % 1000 + 1 for i in range(100_000)]
+
+
+def convert_all(substitution_functions) -> list:
+    return [
+        number_to_hebrew_string(n, substitution_functions=substitution_functions)
+        for n in NUMBERS
+    ]
+
+
+def chain(functions, values: list) -> list:
+    """How substitutions were applied before; each function is called on the result of the previous one."""
+    results = []
+    for value in values:
+        for func in functions:
+            value = func(value)
+        results.append(value)
+    return results
+
+
+def report(name: str, func, number: int = 1) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{name:<45} {seconds * 1000:>10.1f} ms")
+    return seconds
+
+
+def main():
+    print(f"Numbers: {len(NUMBERS):,}\n")
+    for name, substitution_functions in (
+        ("DEFAULT", Substitutions.DEFAULT),
+        ("ALL", Substitutions.ALL),
+    ):
+        set_number_cache_limit(0)
+        expected = convert_all(substitution_functions)
+        before = report(
+            f"Substitutions.{name}, no memoization (before)",
+            lambda: convert_all(substitution_functions),
+        )
+        set_number_cache_limit()
+        assert convert_all(substitution_functions) == expected
+        after = report(
+            f"Substitutions.{name}, memoized (after)",
+            lambda: convert_all(substitution_functions),
+        )
+        print(f"{'speedup':<45} {before / after:>10.1f} x\n")
+
+    values = [
+        number_to_hebrew_string(n, False, substitution_functions=None) for n in NUMBERS
+    ]
+    compiled = CompiledSubstitutions(Substitutions.ALL)
+    assert list(map(compiled, values)) == chain(Substitutions.ALL, values)
+    before = report(
+        "Substitutions.ALL, chained (before)",
+        lambda: chain(Substitutions.ALL, values),
+    )
+    after = report(
+        "Substitutions.ALL, compiled (after)",
+        lambda: list(map(compiled, values)),
+    )
+    print(f"{'speedup':<45} {before / after:>10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmarks for finding phrases of up to 10 words with a given gematria in a book sized text (~20 thousand words).
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_phrase_search
+"""
+
+import timeit
+
+from hebrew import Hebrew
+from hebrew.phrase_search import find_phrases_with_gematria
+from tests.test_hebrew import taamei_hamikra
+
+WORDS_IN_BOOK = 20_000
+WORDS = [w for p in taamei_hamikra for w in Hebrew(p).iter_words(as_str=True)]
+BOOK = [WORDS[i % len(WORDS)] for i in range(WORDS_IN_BOOK)]
+MAX_WORDS = 10
+VALUE = 913
+
+
+def joined_substrings(words: list, value: int) -> list:
+    """How phrases were searched before; the gematria of every run of words is calculated from its joined string."""
+    return [
+        (start, end)
+        for end in range(1, len(words) + 1)
+        for start in range(max(0, end - MAX_WORDS), end)
+        if Hebrew(" ".join(words[start:end])).gematria() == value
+    ]
+
+
+def report(name: str, func, number: int = 1) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{name:<45} {seconds * 1000:>10.1f} ms")
+    return seconds
+
+
+def main():
+    matches = find_phrases_with_gematria(BOOK, VALUE, max_words=MAX_WORDS)
+    print(f"Text: {len(BOOK):,} words, {len(matches):,} phrases equal to {VALUE}\n")
+    assert joined_substrings(BOOK, VALUE) == [(m.start, m.end) for m in matches]
+
+    before = report(
+        "joined substrings (before)", lambda: joined_substrings(BOOK, VALUE)
+    )
+    after = report(
+        "find_phrases_with_gematria (after)",
+        lambda: find_phrases_with_gematria(BOOK, VALUE, max_words=MAX_WORDS),
+        number=10,
+    )
+    print(f"{'speedup':<45} {before / after:>10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+A reusable pipeline that combines the text cleaning methods of `Hebrew` into a single precompiled transform.
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
+
+from .chars import (
+    MAQAF,
+    NIQQUD_CHARS,
+    TAAMIM_CHARS,
+    PASEQ,
+    SOF_PASSUK,
+    _NON_LETTER_CHARS,
+    BaseHebrewChar,
+    SPECIAL_CHARACTER_NORMALIZED_MAPPING,
+    YiddishChar,
+)
+from .grapheme_string import GraphemeString
+
+
+def _remove_chars(string: str, chars: Tuple[str, ...]) -> str:
+    """Removes each of the chars from the string."""
+    for char in chars:
+        string = string.replace(char, "")
+    return string
+
+
+def _single_codepoint_chars(chars: List[BaseHebrewChar]) -> Tuple[str, ...]:
+    """
+    Returns the chars that are made of a single codepoint.
+
+    Chars made up of more than one codepoint (such as "וּ") are skipped; their marks are removed on their own.
+    """
+    return tuple(c.char for c in chars if len(c.char) == 1)
+
+
+# The chars removed by `text_only`, `no_niqqud` and `no_taamim`, built once at import. `str.replace` is used rather
+# than `str.translate` since, for non-ASCII text, `str.translate` looks up every character and is measurably slower.
+_TEXT_ONLY_REMOVALS = _single_codepoint_chars(
+    [c for c in _NON_LETTER_CHARS if c not in (MAQAF, PASEQ)]
+)
+_NIQQUD_REMOVALS = _single_codepoint_chars(NIQQUD_CHARS)
+_TAAMIM_REMOVALS = _single_codepoint_chars(
+    [p for p in TAAMIM_CHARS if p not in (MAQAF, PASEQ, SOF_PASSUK)]
+)
+
+
+def _normalization_pairs(normalize_yiddish: bool) -> Tuple[Tuple[str, str], ...]:
+    """Returns each special character with its normalized replacement, in the order they are replaced."""
+    return tuple(
+        (k.char, "".join([val.char for val in v]) if isinstance(v, list) else v.char)
+        for k, v in SPECIAL_CHARACTER_NORMALIZED_MAPPING.items()
+        if normalize_yiddish or not isinstance(k, YiddishChar)
+    )
+
+
+# The replacements used by `Hebrew.normalize`, with and without yiddish characters, built once at import. Multi
+# codepoint characters (such as "ײַ") come before the characters they start with, so the order is preserved.
+_NORMALIZATION_PAIRS: Dict[bool, Tuple[Tuple[str, str], ...]] = {
+    False: _normalization_pairs(False),
+    True: _normalization_pairs(True),
+}
+
+
+def _is_normalized(string: str, normalize_yiddish: bool = False) -> bool:
+    """Returns True if `_normalize` would not change the string."""
+    return unicodedata.is_normalized("NFC", string) and not any(
+        special in string for special, _ in _NORMALIZATION_PAIRS[normalize_yiddish]
+    )
+
+
+def _normalize(string: str, normalize_yiddish: bool = False) -> str:
+    """Returns the string with all special hebrew characters replaced. See `Hebrew.normalize`."""
+    if _is_normalized(string, normalize_yiddish):
+        return string
+    normalized = unicodedata.normalize("NFC", string)
+    for special, normal in _NORMALIZATION_PAIRS[normalize_yiddish]:
+        normalized = normalized.replace(special, normal)
+    return normalized
+
+
+class Cleaner:
+    """
+    A reusable combination of the cleaning methods of `Hebrew`, compiled once and applied to a string in one go.
+
+    Chaining methods such as `Hebrew(s).no_taamim(remove_maqaf=True).no_niqqud().normalize()` creates a new `Hebrew`
+    instance for each step. A `Cleaner` works on the plain string and can be reused for any number of strings.
+
+    ``` python
+    >>> clean = Cleaner(no_maqaf=True, no_taamim=True, no_niqqud=True)
+    >>> clean("וַֽיְהִי־עֶ֥רֶב")
+    'ויהי ערב'
+    ```
+
+    The steps are always applied in the same order: normalization first (so that any characters it decomposes are
+    also cleaned), then maqafs, sof passuks and paseqs are handled, and finally niqqud and ta'amim are removed.
+    """
+
+    def __init__(
+        self,
+        normalize: bool = False,
+        normalize_yiddish: bool = False,
+        no_maqaf: bool = False,
+        no_sof_passuk: bool = False,
+        no_taamim: bool = False,
+        no_niqqud: bool = False,
+        text_only: bool = False,
+    ):
+        """
+        :param normalize: Whether to normalize special characters, see `Hebrew.normalize`.
+        :param normalize_yiddish: When normalizing, whether to normalize yiddish characters as well.
+        :param no_maqaf: Whether to replace maqafs with spaces, see `Hebrew.no_maqaf`.
+        :param no_sof_passuk: Whether to remove sof passuk characters, see `Hebrew.no_sof_passuk`.
+        :param no_taamim: Whether to remove ta'amim, see `Hebrew.no_taamim`.
+        :param no_niqqud: Whether to remove niqqud, see `Hebrew.no_niqqud`.
+        :param text_only: Whether to remove all non-letter characters, see `Hebrew.text_only`.
+        """
+        self.normalize = normalize
+        self.normalize_yiddish = normalize_yiddish
+        self.no_maqaf = no_maqaf
+        self.no_sof_passuk = no_sof_passuk
+        self.no_taamim = no_taamim
+        self.no_niqqud = no_niqqud
+        self.text_only = text_only
+
+        removals = ()
+        if text_only:
+            removals += _TEXT_ONLY_REMOVALS
+        if no_taamim:
+            removals += _TAAMIM_REMOVALS
+        if no_niqqud:
+            removals += _NIQQUD_REMOVALS
+        # Each char only needs to be removed once.
+        self._removals: Tuple[str, ...] = tuple(dict.fromkeys(removals))
+        self._remove_paseq: bool = text_only or no_taamim
+
+    def __call__(self, string: Union[str, GraphemeString]) -> str:
+        """
+        Cleans a string.
+
+        :param string: The string (or `Hebrew` instance) to clean.
+        :return: The cleaned string.
+        """
+        string = str(string)
+        if self.normalize:
+            string = _normalize(string, self.normalize_yiddish)
+        if self.no_maqaf:
+            string = string.replace(MAQAF.char, " ")
+        if self.no_sof_passuk:
+            string = string.replace(SOF_PASSUK.char, "")
+        if self._remove_paseq:
+            # Handled separately to avoid double spaces.
+            string = string.replace(f" {PASEQ.char} ", " ")
+        return _remove_chars(string, self._removals)
+
+    def __repr__(self) -> str:
+        options = [
+            "normalize",
+            "normalize_yiddish",
+            "no_maqaf",
+            "no_sof_passuk",
+            "no_taamim",
+            "no_niqqud",
+            "text_only",
+        ]
+        enabled = ", ".join(f"{o}=True" for o in options if getattr(self, o))
+        return f"{self.__class__.__name__}({enabled})"
+
+
+@lru_cache(maxsize=None)
+def _get_cleaner(*options: bool) -> Cleaner:
+    """Returns a shared `Cleaner` for a combination of options, so it is only compiled once."""
+    return Cleaner(*options)
@@ -0,0 +1,225 @@
+"""
+Equidistant letter sequence (ELS) search: finding a term spelled by letters at a fixed distance from each other.
+"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from .chars import FINAL_MINOR_LETTER_MAPPINGS
+from .gematria import MISPAR_HECHRACHI, _import_numpy
+from .grapheme_string import GraphemeString
+from .hebrew_obj import Hebrew
+
+# The 27 hebrew letters, each encoded as a single byte so that a letter stream can be searched as `bytes`.
+_LETTERS = "".join(sorted(MISPAR_HECHRACHI))
+_LETTER_CODES: Dict[str, int] = {letter: i + 1 for i, letter in enumerate(_LETTERS)}
+_LETTER_TO_CODE = {ord(letter): code for letter, code in _LETTER_CODES.items()}
+_NORMALIZE_FINALS = str.maketrans(
+    {final: FINAL_MINOR_LETTER_MAPPINGS[final] for final in "ךםןףץ"}
+)
+
+
+class ELSMatch(NamedTuple):
+    """
+    An occurrence of a term as an equidistant letter sequence.
+    """
+
+    start: int
+    """The index of the term's first letter in `ELSText.letters`."""
+    skip: int
+    """The distance between consecutive letters of the term. Negative when the term is spelled backwards."""
+    length: int
+    """The number of letters in the term."""
+
+    @property
+    def positions(self) -> range:
+        """The indices of the term's letters in `ELSText.letters`, in the order of the term."""
+        return range(self.start, self.start + self.length * self.skip, self.skip)
+
+
+class ELSText:
+    """
+    A text stripped down to its letters, searchable for equidistant letter sequences.
+
+    ``` python
+    >>> els = ELSText("בְּרֵאשִׁית בָּרָא אֱלֹהִים אֵת הַשָּׁמַיִם וְאֵת הָאָרֶץ")
+    >>> els.search("ראה", max_skip=10)
+    [ELSMatch(start=26, skip=-1, length=3), ELSMatch(start=7, skip=2, length=3)]
+    >>> els.letters[7:12:2]
+    'ראה'
+    ```
+    """
+
+    def __init__(self, text: Union[str, GraphemeString], normalize_finals: bool = True):
+        """
+        :param text: The text to search. Everything but its letters (niqqud, ta'amim, punctuation, spaces and any
+        non-hebrew characters) is removed, see `Hebrew.text_only`.
+        :param normalize_finals: Whether final letters (such as "ם") are treated as their regular form (such as "מ"),
+        in both the text and the searched terms, as is customary for ELS searches.
+        """
+        self.normalize_finals = normalize_finals
+        self.letters: str = self._letters_of(text)
+        """The letters of the text. The indices in `ELSMatch` refer to this string."""
+        # Each letter as a single byte, for the regular expression search and to be viewed as a NumPy array.
+        self._codes: bytes = self.letters.translate(_LETTER_TO_CODE).encode("latin-1")
+        self._counts: Dict[str, int] = {}
+        self._positions: Dict[str, List[int]] = {}
+        self._numpy_codes_cache: Optional[Any] = None
+        self._numpy_positions_cache: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of letters in the text."""
+        return len(self.letters)
+
+    def positions(self, letter: str) -> List[int]:
+        """
+        Returns the indices of every occurrence of a letter in `letters`, in ascending order.
+
+        The positions of each letter are found once and cached.
+
+        ``` python
+        >>> ELSText("בְּרֵאשִׁית בָּרָא").positions("ר")
+        [1, 7]
+        ```
+
+        :param letter: The letter to find. A final letter is treated as its regular form if `normalize_finals` is set.
+        :return: A list of the indices of the letter. Empty if it is not a single hebrew letter.
+        """
+        if self.normalize_finals:
+            letter = letter.translate(_NORMALIZE_FINALS)
+        if letter not in _LETTER_CODES:
+            return []
+        positions = self._positions.get(letter)
+        if positions is None:
+            code = re.escape(bytes([_LETTER_CODES[letter]]))
+            positions = self._positions[letter] = [
+                m.start() for m in re.finditer(code, self._codes)
+            ]
+        return list(positions)
+
+    def _letters_of(self, text: Union[str, GraphemeString]) -> str:
+        """Returns only the hebrew letters of a text, with final letters normalized if `normalize_finals` is set."""
+        letters = Hebrew(str(text)).clean(normalize=True, text_only=True).string
+        if self.normalize_finals:
+            letters = letters.translate(_NORMALIZE_FINALS)
+        return "".join(filter(_LETTER_CODES.__contains__, letters))
+
+    def _count(self, letter: str) -> int:
+        count = self._counts.get(letter)
+        if count is None:
+            count = self._counts[letter] = self.letters.count(letter)
+        return count
+
+    def _normalize_term(self, term: Union[str, GraphemeString]) -> str:
+        term = self._letters_of(term)
+        if len(term) < 2:
+            raise ValueError("The searched term must have at least two hebrew letters")
+        return term
+
+    def search(
+        self,
+        term: Union[str, GraphemeString],
+        min_skip: int = 1,
+        max_skip: int = 1000,
+        backwards: bool = True,
+        use_numpy: Optional[bool] = None,
+    ) -> List[ELSMatch]:
+        """
+        Returns every occurrence of the term as an equidistant letter sequence, with a skip between `min_skip` and
+        `max_skip` (inclusive).
+
+        Only the occurrences of the term's rarest letter are considered as candidates, and each is checked against the
+        rest of the term's letters, rarest first. When [NumPy](https://numpy.org/) is installed, the candidates of each
+        skip are checked as vectors. Otherwise, each skip is searched with a regular expression anchored on the rarest
+        letter. Both return the same results, ordered by skip (each positive skip before its negative) and then by
+        start.
+
+        :param term: The term to search for. Its niqqud, ta'amim and other non-letter characters are ignored.
+        :param min_skip: The smallest distance between consecutive letters of the term.
+        :param max_skip: The largest distance between consecutive letters of the term.
+        :param backwards: Whether to also search for the term spelled backwards, reported with a negative skip.
+        :param use_numpy: Whether to use NumPy for the search. By default, NumPy is used if it is installed.
+        :return: A list of the occurrences of the term.
+        """
+        if min_skip < 1 or max_skip < min_skip:
+            raise ValueError(
+                f"Skips must satisfy 1 <= min_skip <= max_skip, got {min_skip} and {max_skip}"
+            )
+        term = self._normalize_term(term)
+        # A term of k letters with a skip of d spans (k - 1) * d + 1 letters, so larger skips can't match.
+        max_skip = min(max_skip, (len(self.letters) - 1) // (len(term) - 1))
+
+        if _import_numpy(use_numpy) is not None:
+            search_skip = self._search_skip_numpy
+        else:
+            search_skip = self._search_skip
+        matches: List[ELSMatch] = []
+        span = len(term) - 1
+        for skip in range(min_skip, max_skip + 1):
+            matches.extend(
+                ELSMatch(start, skip, len(term)) for start in search_skip(term, skip)
+            )
+            if backwards:
+                # The term spelled backwards with a skip of d is the reversed term spelled forwards.
+                matches.extend(
+                    ELSMatch(start + span * skip, -skip, len(term))
+                    for start in search_skip(term[::-1], skip)
+                )
+        return matches
+
+    def _letter_order(self, term: str) -> List[int]:
+        """Returns the indices of the term's letters, from the rarest letter in the text to the most common."""
+        return sorted(range(len(term)), key=lambda i: self._count(term[i]))
+
+    def _search_skip(self, term: str, skip: int) -> List[int]:
+        """Returns the start of every forward occurrence of the term with the given skip."""
+        rarest = self._letter_order(term)[0]
+        codes = [re.escape(bytes([_LETTER_CODES[letter]])) for letter in term]
+        gap = b".{%d}" % (skip - 1)
+        # The pattern starts with the rarest letter so that the regular expression engine can quickly skip to its
+        # occurrences, and checks the letters before and after it with fixed width lookarounds.
+        pattern = codes[rarest]
+        if rarest:
+            pattern += b"(?<=" + gap.join(codes[: rarest + 1]) + b")"
+        if rarest < len(term) - 1:
+            pattern += b"(?=" + gap + gap.join(codes[rarest + 1 :]) + b")"
+        offset = rarest * skip
+        return [
+            m.start() - offset
+            for m in re.finditer(pattern, self._codes, re.DOTALL)
+            if m.start() >= offset
+        ]
+
+    def _search_skip_numpy(self, term: str, skip: int) -> List[int]:
+        """Returns the start of every forward occurrence of the term with the given skip, using NumPy."""
+        order = self._letter_order(term)
+        rarest = order[0]
+        # Every occurrence must have its rarest letter at one of that letter's positions, so the candidate starts are
+        # those positions shifted back, and each of the other letters (rarest first) filters them further.
+        starts = self._numpy_positions(term[rarest]) - rarest * skip
+        starts = starts[(starts >= 0) & (starts + (len(term) - 1) * skip < len(self))]
+        codes = self._numpy_codes()
+        for i in order[1:]:
+            if not len(starts):
+                break
+            starts = starts[codes[starts + i * skip] == _LETTER_CODES[term[i]]]
+        return starts.tolist()
+
+    def _numpy_codes(self):
+        """Returns the letters as a NumPy array of their single byte codes."""
+        import numpy as np
+
+        if self._numpy_codes_cache is None:
+            self._numpy_codes_cache = np.frombuffer(self._codes, dtype=np.uint8)
+        return self._numpy_codes_cache
+
+    def _numpy_positions(self, letter: str):
+        """Returns the positions of a letter as a NumPy array, computed once per letter."""
+        import numpy as np
+
+        positions = self._numpy_positions_cache.get(letter)
+        if positions is None:
+            positions = self._numpy_positions_cache[letter] = np.flatnonzero(
+                self._numpy_codes() == _LETTER_CODES[letter]
+            )
+        return positions
@@ -1,5 +1,9 @@
+from collections import Counter
 from enum import Enum
-from typing import Dict
+from functools import lru_cache
+from itertools import accumulate, count, repeat
+from operator import mul
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence
 
 
 class GematriaTypes(Enum):
@@ -562,3 +566,350 @@ REVERSE_AVGAD: Dict[str, int] = {
     "ש": 200,
     "ת": 300,
 }
+
+_SIMPLE_GEMATRIA_VALUES: Dict[GematriaTypes, Dict[str, int]] = {
+    GematriaTypes.MISPAR_HECHRACHI: MISPAR_HECHRACHI,
+    GematriaTypes.MISPAR_GADOL: MISPAR_GADOL,
+    GematriaTypes.MISPAR_SIDURI: MISPAR_SIDURI,
+    GematriaTypes.MISPAR_KATAN: MISPAR_KATAN,
+    GematriaTypes.MISPAR_PERATI: MISPAR_PERATI,
+    GematriaTypes.ATBASH: ATBASH,
+    GematriaTypes.ALBAM: ALBAM,
+    GematriaTypes.MISPAR_MESHULASH: MISPAR_MESHULASH,
+    GematriaTypes.MISPAR_KIDMI: MISPAR_KIDMI,
+    GematriaTypes.MISPAR_MISPARI: MISPAR_MISPARI,
+    GematriaTypes.AYAK_BACHAR: AYAK_BACHAR,
+    GematriaTypes.OFANIM: OFANIM,
+    GematriaTypes.ACHAS_BETA: ACHAS_BETA,
+    GematriaTypes.AVGAD: AVGAD,
+    GematriaTypes.REVERSE_AVGAD: REVERSE_AVGAD,
+}
+"""
+A lookup of each simple gematria method to a map of codepoint to value. Used internally to calculate simple gematria
+values in a single pass over a string, without going through the `HebrewChar` metadata for each character.
+"""
+
+_GEMATRIA_CHARS: FrozenSet[str] = frozenset(MISPAR_HECHRACHI) | {" "}
+"""
+The characters that are kept when a string is cleaned for calculating complex gematria methods; the hebrew
+letters (the same letters as `hebrew.chars.HEBREW_CHARS`) and the space character.
+"""
+
+
+def calculate_gematria(
+    string: str,
+    method: GematriaTypes = GematriaTypes.MISPAR_HECHRACHI,
+    alt_letter_name_spelling: Optional[Dict[str, str]] = None,
+) -> int:
+    """
+    Returns the gematria of a string.
+
+    This is the calculation behind `Hebrew.gematria`, usable on a plain `str` without creating a `Hebrew` instance.
+    If the string contains no hebrew characters, the value returned is 0. Mixing hebrew and english characters is ok!
+
+    ``` python
+    >>> calculate_gematria("אחד")
+    13
+    >>> calculate_gematria("אחד", GematriaTypes.MISPAR_BONEEH)
+    23
+    ```
+
+    :param string: The string to calculate the gematria of.
+    :param method: The method to use for calculating the gematria.
+    :param alt_letter_name_spelling: Used only with MISPAR_SHEMI_MILUI: A dict of alternate spellings for a letter
+    that should be used to make the calculation. Eg: `{"ו": "ואו"}`.
+    :return:
+    """
+    if method in _SIMPLE_GEMATRIA_VALUES:
+        # Simple gematria that can be calculated by simply adding each letters value up to a final number.
+        return _calculate_simple_gematria(string, method)
+
+    return calculate_gematria_all(string, (method,), alt_letter_name_spelling)[method]
+
+
+def calculate_gematria_all(
+    string: str,
+    methods: Optional[Iterable[GematriaTypes]] = None,
+    alt_letter_name_spelling: Optional[Dict[str, str]] = None,
+) -> Dict[GematriaTypes, int]:
+    """
+    Returns the gematria of a string for several methods at once.
+
+    The string is cleaned and its letters are counted a single time, and every requested method is calculated from
+    those counts. This is much faster than calling `calculate_gematria` once per method.
+
+    ``` python
+    >>> calculate_gematria_all("אחד", [GematriaTypes.MISPAR_HECHRACHI, GematriaTypes.MISPAR_GADOL])
+    {<GematriaTypes.MISPAR_HECHRACHI: 'mispar_hechrachi'>: 13, <GematriaTypes.MISPAR_GADOL: 'mispar_gadol'>: 13}
+    ```
+
+    :param string: The string to calculate the gematria of.
+    :param methods: The methods to calculate. When None, all methods in `GematriaTypes` are calculated.
+    :param alt_letter_name_spelling: Used only with MISPAR_SHEMI_MILUI: A dict of alternate spellings for a letter
+    that should be used to make the calculation. Eg: `{"ו": "ואו"}`.
+    :return: A dict with each requested method as a key, and the gematria for that method as its value.
+    """
+    methods = GematriaTypes if methods is None else methods
+
+    # Remove non hebrew characters
+    cleaned_string: str = "".join(filter(_GEMATRIA_CHARS.__contains__, string))
+    letters = cleaned_string.replace(" ", "")
+    letter_counts = Counter(letters)
+
+    def total(values: Dict[str, int]) -> int:
+        return sum([values[c] * n for c, n in letter_counts.items()])
+
+    value = total(MISPAR_HECHRACHI)
+    names: Dict[str, str] = {}
+    results: Dict[GematriaTypes, int] = {}
+    for method in methods:
+        if method in _SIMPLE_GEMATRIA_VALUES:
+            # Simple gematria that can be calculated by simply adding each letters value up to a final number.
+            results[method] = total(_SIMPLE_GEMATRIA_VALUES[method])
+
+        elif method == GematriaTypes.MISPAR_MUSAFI:
+            # Mispar Musafi (Heb: מספר מוספי) adds the number of letters in the word or phrase to the value.
+            results[method] = value + len(letters)
+
+        elif method == GematriaTypes.MISPAR_KOLEL:
+            # Mispar Kolel (Heb: מספר כלל) is the value plus the number of words in the phrase.
+            results[method] = value + len(cleaned_string.split())
+
+        elif method == GematriaTypes.MISPAR_BONEEH:
+            # Mispar Bone'eh (building value) (Heb: מספר בונה) adds the value of all previous letters in the word to
+            # the value of the current letter as the word is calculated. (ex. Echad is 1 + (1 + 8) + (1 + 8 + 4) = 23).
+            # Each letter's building value is the running sum of the values up to and including that letter.
+            results[method] = sum(
+                accumulate(map(MISPAR_HECHRACHI.__getitem__, letters))
+            )
+
+        elif method == GematriaTypes.MISPAR_HAMERUBAH_HAKLALI:
+            # Mispar HaMerubah HaKlali (Heb: מספר המרובע הכללי) is the standard value squared.
+            results[method] = value**2
+
+        elif method == GematriaTypes.MISPAR_HAACHOR:
+            # Mispar Ha'achor (sometimes called Mispar Meshulash, triangular value) (Heb: מספר האחור) values each
+            # letter as its value multiplied by the position of the letter in the word or phrase.
+            results[method] = sum(
+                map(mul, map(MISPAR_HECHRACHI.__getitem__, letters), count(1))
+            )
+
+        elif method == GematriaTypes.MISPAR_KATAN_MISPARI:
+            # Mispar Katan Mispari (integral reduced value) (Heb: מספר קטן מספרי) is the digital root of the
+            # standard value which is obtained by adding all the digits in the number until the number is a single
+            # digit. (ex. Echad (13) --> 1 + 3 --> 4).
+            calculated_value = value
+            while calculated_value > 9:
+                calculated_value = sum([int(x) for x in str(calculated_value)])
+            results[method] = calculated_value
+
+        elif method == GematriaTypes.MISPAR_SHEMI_MILUI:
+            # Mispar Shemi (Milui, full name value) (Heb: מספר שמי\מילוי) values each letter as the value of the
+            # letter's name. (ex. "Aleph" = Aleph + Lamed + Fey = 1 + 30 + 80 = 111).
+            # [Note: There is more than one way to spell certain letters.]
+            names = names or _letter_names(letter_counts, alt_letter_name_spelling)
+            results[method] = total(
+                {c: _calculate_simple_gematria(n) for c, n in names.items()}
+            )
+
+        elif method == GematriaTypes.MISPAR_NEELAM:
+            # Mispar Ne'elam (hidden value) (Heb: מספר נעלם) values each letter as the value of the letter's name
+            # without the letter itself. (ex. "Aleph" = Lamed + Fey = 30 + 80 = 110).
+            names = names or _letter_names(letter_counts, alt_letter_name_spelling)
+            # Remove letter from name and calculate value
+            results[method] = total(
+                {c: _calculate_simple_gematria(n[1:]) for c, n in names.items()}
+            )
+
+        else:
+            raise ValueError(f"{method} is not a supported gematria method")
+
+    return results
+
+
+def gematria_many(
+    strings: Iterable[str],
+    method: GematriaTypes = GematriaTypes.MISPAR_HECHRACHI,
+    alt_letter_name_spelling: Optional[Dict[str, str]] = None,
+) -> List[int]:
+    """
+    Returns the gematria of each string in an iterable of strings.
+
+    The items may be plain strings or `Hebrew` instances. No `Hebrew` instance is created for plain strings, making
+    this the preferred way to calculate the gematria of a large list of words.
+
+    ``` python
+    >>> gematria_many(["אחד", "אהבה"])
+    [13, 13]
+    ```
+
+    :param strings: An iterable of strings (or `Hebrew` instances) to calculate the gematria of.
+    :param method: The method to use for calculating the gematria.
+    :param alt_letter_name_spelling: Used only with MISPAR_SHEMI_MILUI: A dict of alternate spellings for a letter
+    that should be used to make the calculation. Eg: `{"ו": "ואו"}`.
+    :return: A list of the gematria values, in the same order as the input.
+    """
+    return [
+        calculate_gematria(str(s), method, alt_letter_name_spelling) for s in strings
+    ]
+
+
+def gematria_by_word(
+    text: str,
+    method: GematriaTypes = GematriaTypes.MISPAR_HECHRACHI,
+    use_numpy: Optional[bool] = None,
+) -> Sequence[int]:
+    """
+    Returns the gematria of each word in a text, where words are split the same way as `str.split()`.
+
+    When [NumPy](https://numpy.org/) is installed, the whole text is converted to an array of values and the words are
+    summed as vectors, which is much faster for large texts. The result is then a NumPy array of `int64`. Without
+    NumPy, a list of ints is returned.
+
+    Only simple methods, where the value of a word is the sum of the values of its letters, are supported.
+
+    ``` python
+    >>> gematria_by_word("בראשית ברא אלהים", use_numpy=False)
+    [913, 203, 86]
+    ```
+
+    :param text: The text to calculate the gematria of.
+    :param method: The simple method to use for calculating the gematria.
+    :param use_numpy: Whether to use NumPy for the calculation. By default, NumPy is used if it is installed.
+    :return: A sequence with the gematria of each word in the text.
+    """
+    return _gematria_by_segment(text, method, use_numpy, lines=False)
+
+
+def gematria_by_line(
+    text: str,
+    method: GematriaTypes = GematriaTypes.MISPAR_HECHRACHI,
+    use_numpy: Optional[bool] = None,
+) -> Sequence[int]:
+    """
+    Returns the gematria of each line in a text, where lines are split the same way as `str.splitlines()`.
+
+    When [NumPy](https://numpy.org/) is installed, the result is a NumPy array of `int64`, otherwise a list of ints.
+    See `gematria_by_word` for details.
+
+    :param text: The text to calculate the gematria of.
+    :param method: The simple method to use for calculating the gematria.
+    :param use_numpy: Whether to use NumPy for the calculation. By default, NumPy is used if it is installed.
+    :return: A sequence with the gematria of each line in the text.
+    """
+    return _gematria_by_segment(text, method, use_numpy, lines=True)
+
+
+def _import_numpy(use_numpy: Optional[bool]):
+    """
+    Returns the numpy module, or None if it shouldn't be used.
+
+    :param use_numpy: True to require NumPy (an ImportError is raised if it isn't installed), False to never use it,
+    or None to use it only if it is installed.
+    """
+    if use_numpy is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if use_numpy:
+            raise
+        return None
+    return numpy
+
+
+def _gematria_by_segment(
+    text: str, method: GematriaTypes, use_numpy: Optional[bool], lines: bool
+) -> Sequence[int]:
+    """Returns the gematria of each word or line in a text, using NumPy when requested or available."""
+    if method not in _SIMPLE_GEMATRIA_VALUES:
+        raise ValueError(f"{method} is not a simple gematria method")
+
+    np = _import_numpy(use_numpy)
+    if np is None:
+        segments = text.splitlines() if lines else text.split()
+        return [_calculate_simple_gematria(s, method) for s in segments]
+
+    # Lone surrogates (such as from `errors="surrogateescape"`) are kept, and have no value like any other non-letter.
+    codepoints = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+    values = _numpy_lookup(np, _numpy_value_table(np, method), codepoints)
+    # The sum of the values between any two offsets is the difference of their cumulative sums.
+    cumulative = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+
+    if lines:
+        breaks = _numpy_lookup(np, _numpy_char_table(np, _LINE_BREAKS), codepoints)
+        # "\r\n" is a single line break of two characters.
+        crlf = np.zeros(len(codepoints), dtype=bool)
+        crlf[:-1] = (codepoints[:-1] == 0x0D) & (codepoints[1:] == 0x0A)
+        breaks[1:] &= ~crlf[:-1]
+        ends = np.flatnonzero(breaks)
+        starts = np.concatenate(([0], ends + 1 + crlf[ends]))
+        # Like str.splitlines, there is no empty line after a final line break.
+        if len(starts) > len(ends) and starts[-1] < len(text):
+            ends = np.append(ends, len(text))
+        starts = starts[: len(ends)]
+    else:
+        in_word = ~_numpy_lookup(np, _numpy_char_table(np, _WHITESPACE), codepoints)
+        edges = np.diff(np.concatenate(([False], in_word, [False])).astype(np.int8))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+    return cumulative[ends] - cumulative[starts]
+
+
+def _numpy_lookup(np, table, codepoints):
+    """Looks up each codepoint in a dense table whose last entry is the value for all codepoints out of its range."""
+    return table[np.minimum(codepoints, len(table) - 1)]
+
+
+@lru_cache(maxsize=None)
+def _numpy_value_table(np, method: GematriaTypes):
+    """A dense array of the value of every codepoint up to the last hebrew letter, for a simple gematria method."""
+    values = _SIMPLE_GEMATRIA_VALUES[method]
+    table = np.zeros(max(map(ord, values)) + 2, dtype=np.int64)
+    for char, value in values.items():
+        table[ord(char)] = value
+    return table
+
+
+@lru_cache(maxsize=None)
+def _numpy_char_table(np, chars: str):
+    """A dense boolean array marking the codepoints in `chars`."""
+    table = np.zeros(max(map(ord, chars)) + 2, dtype=bool)
+    table[[ord(c) for c in chars]] = True
+    return table
+
+
+_WHITESPACE = "".join(chr(c) for c in range(0x3001) if chr(c).isspace())
+"""Every character that `str.split()` splits on. There are no whitespace characters above U+3000."""
+
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+"""Every character that `str.splitlines()` splits on."""
+
+
+def _calculate_simple_gematria(
+    string: str, method: GematriaTypes = GematriaTypes.MISPAR_HECHRACHI
+) -> int:
+    """Calculate Gematria for simple Gematria that use a value map for each letter."""
+    # Characters that have no value in the method (including non hebrew characters) count as 0.
+    return sum(map(_SIMPLE_GEMATRIA_VALUES[method].get, string, repeat(0)))
+
+
+def _letter_names(
+    letters: Iterable[str], alt_letter_name_spelling: Optional[Dict[str, str]]
+) -> Dict[str, str]:
+    """Returns a dict of each hebrew letter in `letters` to the name of that letter."""
+    # Imported here since `hebrew.chars` depends on the value maps in this module.
+    from hebrew.chars import CHARS, FINAL_MINOR_LETTER_MAPPINGS
+    from hebrew.hebrew_obj import get_hebrew_name
+
+    names = {}
+    for letter in letters:
+        char = CHARS[letter]
+        # Convert final letters to non-final since our internal lib naming for final letters
+        # will ruin the calculation.
+        if char.final_letter:
+            char = CHARS[FINAL_MINOR_LETTER_MAPPINGS.get(char.char)]
+        # Get internal or user supplied names.
+        names[letter] = get_hebrew_name(char, alt_letter_name_spelling)
+    return names
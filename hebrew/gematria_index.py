@@ -0,0 +1,445 @@
+"""
+An inverted index from gematria values to the words and phrases of a corpus that have them.
+"""
+
+import functools
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, chain
+from typing import BinaryIO, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .gematria import GematriaTypes, calculate_gematria_all
+
+# The header of an index file: magic, byte order, format version, gematria method, and the number of values, postings,
+# texts and bytes of text. It is followed by these sections, each aligned to 8 bytes. Values and locations larger than
+# int64 can't be stored, see `GematriaIndex.save`:
+#   values        int64[values]         The distinct gematria values, sorted.
+#   offsets       int64[values + 1]     Where the postings of each value start in the posting arrays.
+#   word ids      int64[postings]       The word id of each posting, grouped by value.
+#   locations     int64[postings]       The location of each posting, grouped by value.
+#   text offsets  int64[texts + 1]      Where each text starts in the text section.
+#   text          bytes                 The texts, utf-8 encoded, one after the other.
+_HEADER = struct.Struct("=8s2sH32sQQQQ")
+_MAGIC = b"HEBGIDX\0"
+_VERSION = 1
+_BYTE_ORDER = b"le" if sys.byteorder == "little" else b"be"
+
+
+class Posting(NamedTuple):
+    """
+    An occurrence of a word or phrase in the indexed corpus.
+    """
+
+    word_id: int
+    """The id of the word or phrase, see `GematriaIndex.text`."""
+    location: int
+    """Where the word or phrase occurs in the corpus, such as its position in the text."""
+
+
+class GematriaIndex:
+    """
+    Maps gematria values to the words and phrases that have them, for one or more `GematriaTypes`.
+
+    The gematria of each distinct word or phrase is calculated once, when it is first added. After that, finding all
+    words equal to a value, or all words within a range of values, is a dict lookup or a binary search.
+
+    ``` python
+    >>> index = GematriaIndex()
+    >>> index.add_words("בְּרֵאשִׁית בָּרָא אֱלֹהִים אֵת הַשָּׁמַיִם וְאֵת הָאָרֶץ".split())
+    [0, 1, 2, 3, 4, 5, 6]
+    >>> index.find_texts(86)
+    ['אֱלֹהִים']
+    >>> index.find(86)
+    [Posting(word_id=2, location=2)]
+    ```
+    """
+
+    def __init__(
+        self,
+        methods: Iterable[GematriaTypes] = (GematriaTypes.MISPAR_HECHRACHI,),
+    ):
+        """
+        :param methods: The gematria methods to index. The first one is used when a query does not specify a method.
+        """
+        self.methods: Tuple[GematriaTypes, ...] = tuple(dict.fromkeys(methods))
+        if not self.methods:
+            raise ValueError("At least one gematria method must be indexed")
+        self._texts: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._word_values: List[Dict[GematriaTypes, int]] = []
+        self._postings: Dict[GematriaTypes, Dict[int, List[Posting]]] = {
+            method: {} for method in self.methods
+        }
+        self._word_ids: Dict[GematriaTypes, Dict[int, List[int]]] = {
+            method: {} for method in self.methods
+        }
+        # Sorted lists of the values in `_postings`, rebuilt on the first range query after a new value is added.
+        self._sorted_values: Dict[GematriaTypes, Optional[List[int]]] = {
+            method: [] for method in self.methods
+        }
+        self._next_location = 0
+
+    def add(self, text: str, location: Optional[int] = None) -> int:
+        """
+        Adds an occurrence of a word or phrase to the index.
+
+        :param text: The word or phrase.
+        :param location: Where the word or phrase occurs in the corpus. Defaults to the location after the previous
+        one added, so adding the words of a text in order gives each word its position in the text.
+        :return: The id of the word or phrase. Occurrences of the same text share a single id.
+        """
+        word_id = self._ids.get(text)
+        new_word = word_id is None
+        if new_word:
+            word_id = self._ids[text] = len(self._texts)
+            self._texts.append(text)
+            self._word_values.append(calculate_gematria_all(text, self.methods))
+        values = self._word_values[word_id]
+
+        if location is None:
+            location = self._next_location
+        self._next_location = location + 1
+
+        posting = Posting(word_id, location)
+        for method in self.methods:
+            value = values[method]
+            postings = self._postings[method]
+            if value not in postings:
+                postings[value] = []
+                self._word_ids[method][value] = []
+                self._sorted_values[method] = None
+            postings[value].append(posting)
+            if new_word:
+                self._word_ids[method][value].append(word_id)
+        return word_id
+
+    def add_words(self, words: Iterable[str]) -> List[int]:
+        """
+        Adds a sequence of words (or phrases) to the index, each at the location after the previous one.
+
+        :param words: The words to add, such as `Hebrew(text).iter_words(as_str=True)`.
+        :return: The id of each word.
+        """
+        return [self.add(word) for word in words]
+
+    def _method(self, method: Optional[GematriaTypes]) -> GematriaTypes:
+        if method is None:
+            return self.methods[0]
+        if method not in self._postings:
+            raise ValueError(f"{method} is not indexed, expected one of {self.methods}")
+        return method
+
+    def find(self, value: int, method: Optional[GematriaTypes] = None) -> List[Posting]:
+        """
+        Returns every occurrence of a word or phrase whose gematria equals the value, in the order they were added.
+
+        :param value: The gematria value to search for.
+        :param method: The gematria method of the value. Defaults to the first indexed method.
+        :return:
+        """
+        return list(self._postings[self._method(method)].get(value, ()))
+
+    def find_range(
+        self, low: int, high: int, method: Optional[GematriaTypes] = None
+    ) -> List[Posting]:
+        """
+        Returns every occurrence of a word or phrase whose gematria is between `low` and `high` (inclusive), ordered by
+        value.
+
+        :param low: The lowest gematria value to include.
+        :param high: The highest gematria value to include.
+        :param method: The gematria method of the values. Defaults to the first indexed method.
+        :return:
+        """
+        method = self._method(method)
+        postings = self._postings[method]
+        values = self._values(method)
+        return list(
+            chain.from_iterable(
+                postings[v]
+                for v in values[bisect_left(values, low) : bisect_right(values, high)]
+            )
+        )
+
+    def find_texts(
+        self, value: int, method: Optional[GematriaTypes] = None
+    ) -> List[str]:
+        """
+        Returns the distinct words and phrases whose gematria equals the value, in the order they were first added.
+
+        :param value: The gematria value to search for.
+        :param method: The gematria method of the value. Defaults to the first indexed method.
+        :return:
+        """
+        word_ids = self._word_ids[self._method(method)].get(value, ())
+        return [self._texts[word_id] for word_id in word_ids]
+
+    def _values(self, method: GematriaTypes) -> List[int]:
+        values = self._sorted_values[method]
+        if values is None:
+            values = self._sorted_values[method] = sorted(self._postings[method])
+        return values
+
+    def values(self, method: Optional[GematriaTypes] = None) -> List[int]:
+        """
+        Returns the distinct gematria values in the index, sorted.
+
+        :param method: The gematria method of the values. Defaults to the first indexed method.
+        :return:
+        """
+        return list(self._values(self._method(method)))
+
+    def text(self, word_id: int) -> str:
+        """
+        Returns the word or phrase with the given id.
+
+        :param word_id: The id returned by `add`, or found in a `Posting`.
+        :return:
+        """
+        return self._texts[word_id]
+
+    def value(self, word_id: int, method: Optional[GematriaTypes] = None) -> int:
+        """
+        Returns the gematria of the word or phrase with the given id.
+
+        :param word_id: The id returned by `add`, or found in a `Posting`.
+        :param method: The gematria method. Defaults to the first indexed method.
+        :return:
+        """
+        return self._word_values[word_id][self._method(method)]
+
+    def __len__(self) -> int:
+        """Returns the number of distinct words and phrases in the index."""
+        return len(self._texts)
+
+    def save(
+        self, path: Union[str, os.PathLike], method: Optional[GematriaTypes] = None
+    ) -> None:
+        """
+        Writes the index of one gematria method to a file, which can be opened with `MappedGematriaIndex`.
+
+        The file stores values and locations as 64 bit signed integers, so they must be between `-2**63` and
+        `2**63 - 1`. A `ValueError` is raised before the file is opened otherwise.
+
+        :param path: The path of the file to write.
+        :param method: The gematria method to save. Defaults to the first indexed method.
+        :return:
+        """
+        method = self._method(method)
+        postings = self._postings[method]
+        values = self._values(method)
+        word_ids = array("q")
+        locations = array("q")
+        offsets = array("q", [0])
+        try:
+            value_array = array("q", values)
+            for value in values:
+                for posting in postings[value]:
+                    word_ids.append(posting.word_id)
+                    locations.append(posting.location)
+                offsets.append(len(word_ids))
+        except OverflowError:
+            raise ValueError(
+                "The index has a value or location that doesn't fit in a 64 bit signed integer, so it can't be saved"
+            ) from None
+        encoded = [t.encode("utf-8") for t in self._texts]
+        text_offsets = array("q", accumulate(map(len, encoded), initial=0))
+        text = b"".join(encoded)
+
+        with open(path, "wb") as f:
+            _write_aligned(
+                f,
+                _HEADER.pack(
+                    _MAGIC,
+                    _BYTE_ORDER,
+                    _VERSION,
+                    method.value.encode("ascii"),
+                    len(values),
+                    len(word_ids),
+                    len(encoded),
+                    len(text),
+                ),
+            )
+            for section in (
+                value_array,
+                offsets,
+                word_ids,
+                locations,
+                text_offsets,
+            ):
+                _write_aligned(f, section.tobytes())
+            _write_aligned(f, text)
+
+
+# Creates a `Posting` from a tuple without going through `Posting.__new__`, which is much slower for large results.
+_new_posting = functools.partial(tuple.__new__, Posting)
+
+
+def _write_aligned(f: BinaryIO, data: bytes) -> None:
+    """Writes the data, padded so that the next section starts on an 8 byte boundary."""
+    f.write(data)
+    f.write(bytes(-f.tell() % 8))
+
+
+class MappedGematriaIndex:
+    """
+    A read only `GematriaIndex` of a single gematria method, queried directly from a file written by
+    `GematriaIndex.save`.
+
+    The file is opened with `mmap` and read through `memoryview`s, so opening it doesn't load the index into Python
+    objects, and processes that open the same file share its pages in the operating system's page cache. Only the
+    results of a query are turned into Python objects.
+
+    ``` python
+    >>> index.save("tanakh.idx")  # doctest: +SKIP
+    >>> with MappedGematriaIndex("tanakh.idx") as mapped:  # doctest: +SKIP
+    ...     mapped.find_texts(26)
+    ```
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """
+        :param path: The path of a file written by `GematriaIndex.save`.
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load()
+        except Exception:
+            self.close()
+            raise
+
+    def _load(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("Not a gematria index file")
+        (
+            magic,
+            byte_order,
+            version,
+            method,
+            n_values,
+            n_postings,
+            n_texts,
+            n_text_bytes,
+        ) = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            raise ValueError("Not a gematria index file")
+        if byte_order != _BYTE_ORDER:
+            raise ValueError(
+                "The gematria index file was written on a machine with a different byte order"
+            )
+        if version != _VERSION:
+            raise ValueError(f"Unsupported gematria index file version {version}")
+        self.method: GematriaTypes = GematriaTypes(method.rstrip(b"\0").decode("ascii"))
+
+        self._views: List[memoryview] = []
+        position = _HEADER.size + (-_HEADER.size % 8)
+
+        def section(length: int, fmt: str = "q") -> memoryview:
+            nonlocal position
+            size = length * (8 if fmt == "q" else 1)
+            if position + size > len(self._mmap):
+                raise ValueError("The gematria index file is truncated")
+            view = memoryview(self._mmap)[position : position + size].cast(fmt)
+            self._views.append(view)
+            position += size + (-size % 8)
+            return view
+
+        self._values = section(n_values)
+        self._offsets = section(n_values + 1)
+        self._word_ids = section(n_postings)
+        self._locations = section(n_postings)
+        self._text_offsets = section(n_texts + 1)
+        self._text = section(n_text_bytes, "B")
+
+    def _range(self, low: int, high: int) -> Tuple[int, int]:
+        """Returns the start and end of the postings of the values between `low` and `high` (inclusive)."""
+        values = self._values
+        first = bisect_left(values, low)
+        last = max(bisect_right(values, high), first)
+        return self._offsets[first], self._offsets[last]
+
+    def _postings(self, start: int, end: int) -> List[Posting]:
+        return list(
+            map(
+                _new_posting,
+                zip(
+                    self._word_ids[start:end].tolist(),
+                    self._locations[start:end].tolist(),
+                ),
+            )
+        )
+
+    def find(self, value: int) -> List[Posting]:
+        """
+        Returns every occurrence of a word or phrase whose gematria equals the value, see `GematriaIndex.find`.
+
+        :param value: The gematria value to search for.
+        :return:
+        """
+        return self._postings(*self._range(value, value))
+
+    def find_range(self, low: int, high: int) -> List[Posting]:
+        """
+        Returns every occurrence of a word or phrase whose gematria is between `low` and `high` (inclusive), see
+        `GematriaIndex.find_range`.
+
+        :param low: The lowest gematria value to include.
+        :param high: The highest gematria value to include.
+        :return:
+        """
+        return self._postings(*self._range(low, high))
+
+    def find_texts(self, value: int) -> List[str]:
+        """
+        Returns the distinct words and phrases whose gematria equals the value, see `GematriaIndex.find_texts`.
+
+        :param value: The gematria value to search for.
+        :return:
+        """
+        start, end = self._range(value, value)
+        return [
+            self.text(word_id)
+            for word_id in dict.fromkeys(self._word_ids[start:end].tolist())
+        ]
+
+    def values(self) -> List[int]:
+        """
+        Returns the distinct gematria values in the index, sorted.
+
+        :return:
+        """
+        return self._values.tolist()
+
+    def text(self, word_id: int) -> str:
+        """
+        Returns the word or phrase with the given id.
+
+        :param word_id: The id found in a `Posting`.
+        :return:
+        """
+        start, end = self._text_offsets[word_id], self._text_offsets[word_id + 1]
+        return bytes(self._text[start:end]).decode("utf-8")
+
+    def __len__(self) -> int:
+        """Returns the number of distinct words and phrases in the index."""
+        return len(self._text_offsets) - 1
+
+    def close(self) -> None:
+        """
+        Closes the file. The index can't be queried after it is closed.
+        """
+        for view in getattr(self, "_views", ()):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedGematriaIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
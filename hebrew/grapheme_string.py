@@ -1,10 +1,48 @@
-from typing import Iterator, TypeVar
+import operator
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Iterator, Optional, Tuple, TypeVar, Union
 
 import grapheme
-from grapheme.finder import GraphemeIterator
+
+from .chars import ALL_CHARS, NIQQUD_CHARS, TAAMIM_CHARS
 
 GraphemeStringT = TypeVar("GraphemeStringT", bound="GraphemeString")
 
+# Every codepoint of the Hebrew blocks is in `chars`. The only ones that continue a grapheme are the niqqud and
+# ta'amim marks, so for text made of these and ASCII a grapheme is either "\r\n", a single control character, or any
+# other character followed by any number of marks.
+_HEBREW_MARKS = "".join(
+    sorted(
+        c.char
+        for c in NIQQUD_CHARS + TAAMIM_CHARS
+        if len(c.char) == 1 and unicodedata.category(c.char) == "Mn"
+    )
+)
+_NOT_HEBREW_OR_ASCII = re.compile(
+    r"[^\x00-\x7f"
+    + "".join(sorted({re.escape(c.char) for c in ALL_CHARS if len(c.char) == 1}))
+    + "]"
+)
+_HEBREW_GRAPHEME = re.compile(
+    rf"\r\n|[\x00-\x1f\x7f]|[^\x00-\x1f\x7f][{_HEBREW_MARKS}]*"
+)
+
+
+def _grapheme_lengths(string: str) -> Iterator[int]:
+    """
+    Returns an iterator of number of code points in each grapheme of the string.
+
+    Strings made only of Hebrew and ASCII characters are segmented with a single regular expression, which is much
+    faster than the `grapheme` library's state machine. Any other string is segmented by the `grapheme` library.
+    """
+    if _NOT_HEBREW_OR_ASCII.search(string) is None:
+        return map(len, _HEBREW_GRAPHEME.findall(string))
+    return grapheme.grapheme_lengths(string)
+
 
 class GraphemeString:
     """
@@ -14,11 +52,44 @@ class GraphemeString:
 
     UNICODE_VERSION: str = grapheme.UNICODE_VERSION
 
+    # Large corpora hold millions of instances, so they don't get a `__dict__`.
+    __slots__ = ("string", "_boundary_cache")
+
     def __init__(self, string: str):
         self.string = string
+        self._boundary_cache: Optional[Tuple[str, array]] = None
+
+    def _cached_boundaries(self) -> Optional[array]:
+        """
+        Returns the grapheme boundary offsets of the string if they were already calculated, otherwise `None`.
+
+        The offsets are cached along with the string they were calculated for, so they are recalculated if
+        `self.string` is replaced.
+        """
+        cache = self._boundary_cache
+        if cache is not None and cache[0] is self.string:
+            return cache[1]
+        return None
+
+    def _boundaries(self) -> array:
+        """
+        Returns the codepoint offset at which each grapheme starts, followed by the length of the string.
+
+        The offsets are calculated on first use and cached, so that `length`, `slice` and the other grapheme based
+        methods don't need to segment the string again on every call.
+        """
+        boundaries = self._cached_boundaries()
+        if boundaries is None:
+            string = self.string
+            boundaries = array(
+                "I" if len(string) < 2**32 else "Q",
+                accumulate(_grapheme_lengths(string), initial=0),
+            )
+            self._boundary_cache = (string, boundaries)
+        return boundaries
 
     @property
-    def graphemes(self) -> Iterator[GraphemeIterator]:
+    def graphemes(self) -> Iterator[str]:
         """
         Returns an iterator of all graphemes of given string.
 
@@ -30,19 +101,18 @@ class GraphemeString:
         ['m', 'u', 'l', 't', 'i', ' ', 'c', 'o', 'd', 'e', 'p', 'o', 'i', 'n', 't', ' ', 'g', 'r', 'a', 'p', 'h', 'e', 'm', 'e', ':', ' ', '🏳️‍🌈']
         ```
         """
-        return grapheme.graphemes(self.string)
+        string = self.string
+        boundaries = self._boundaries()
+        return (string[start:end] for start, end in zip(boundaries, boundaries[1:]))
 
     @property
     def length(self) -> int:
         """
         Returns the number of graphemes in the string.
 
-        Note that this functions needs to traverse the full string to calculate the length,
-        unlike `len(string)` and it's time consumption is linear to the length of the string
-        (up to the `until` value).
-
-        Only counts up to the `until` argument, if given. This is useful when testing
-        the length of a string against some limit and the excess length is not interesting.
+        Note that unlike `len(string)`, this needs to traverse the full string the first time it is called, and it's
+        time consumption is linear to the length of the string. The grapheme boundaries found are cached, so later
+        calls (and calls to `slice`, `graphemes` and `grapheme_lengths`) don't traverse the string again.
 
         ``` python
         >>> rainbow_flag = "🏳️‍🌈"
@@ -52,7 +122,7 @@ class GraphemeString:
         1
         ```
         """
-        return grapheme.length(self.string)
+        return len(self._boundaries()) - 1
 
     def get_length(self, until: int) -> int:
         """
@@ -60,7 +130,7 @@ class GraphemeString:
 
         Note that this functions needs to traverse the full string to calculate the length,
         unlike `len(string)` and it's time consumption is linear to the length of the string
-        (up to the `until` value).
+        (up to the `until` value). If the grapheme boundaries were already cached by `length`, they are used instead.
 
         Only counts up to the `until` argument, if given. This is useful when testing
         the length of a string against some limit and the excess length is not interesting.
@@ -75,20 +145,25 @@ class GraphemeString:
         30
         ```
         """
-        return grapheme.length(self.string, until)
+        boundaries = self._cached_boundaries()
+        if boundaries is None:
+            # Counting up to `until` is cheaper than segmenting the whole string.
+            return grapheme.length(self.string, until)
+        return min(len(boundaries) - 1, until)
 
     @property
     def grapheme_lengths(self) -> Iterator[int]:
         """
         Returns an iterator of number of code points in each grapheme of the string.
         """
-        return grapheme.grapheme_lengths(self.string)
+        boundaries = self._boundaries()
+        return map(operator.sub, boundaries[1:], boundaries)
 
     def slice(self, start: int = None, end: int = None) -> str:
         """
         Returns a substring of the given string, counting graphemes instead of codepoints.
 
-        Negative indices is currently not supported.
+        Negative indices is currently not supported, index the string (`string[-3:]`) instead.
 
         ``` python
         >>> string = "tamil நி (ni)"
@@ -103,7 +178,20 @@ class GraphemeString:
         ' (ni)'
         ```
         """
-        return grapheme.slice(self.string, start, end)
+        if start is None:
+            start = 0
+        if end is not None and start >= end:
+            return ""
+        if start < 0:
+            raise NotImplementedError("Negative indexing is currently not supported.")
+
+        boundaries = self._boundaries()
+        length = len(boundaries) - 1
+        if start >= length:
+            return ""
+        if end is None or end > length:
+            end = length
+        return self.string[boundaries[start] : boundaries[end]]
 
     def contains(self, substring: str) -> bool:
         """
@@ -114,9 +202,9 @@ class GraphemeString:
         grapheme boundaries.
 
         Performance notes: Very fast if `substring not in string`, since that also means that
-        the same graphemes can not be in the two strings. Otherwise this function has linear time
-        complexity in relation to the string length. It will traverse the sequence of graphemes until
-        a match is found, so it will generally perform better for grapheme sequences that match early.
+        the same graphemes can not be in the two strings. Otherwise the string is segmented once (the
+        grapheme boundaries are cached), and each codepoint match is checked against the boundaries
+        with a binary search.
 
         ``` python
         >>> "🇸🇪" in "🇪🇸🇪🇪"
@@ -125,7 +213,31 @@ class GraphemeString:
         False
         ```
         """
-        return grapheme.contains(self.string, substring)
+        string = self.string
+        if substring not in string:
+            return False
+        substring_graphemes = list(grapheme.graphemes(substring))
+        if not substring_graphemes:
+            return True
+
+        boundaries = self._boundaries()
+        index = string.find(substring)
+        while index != -1:
+            # The match must start and end on grapheme boundaries, and contain the same graphemes as the substring.
+            first = bisect_left(boundaries, index)
+            last = first + len(substring_graphemes)
+            if (
+                boundaries[first] == index
+                and last < len(boundaries)
+                and boundaries[last] == index + len(substring)
+                and all(
+                    string[boundaries[i] : boundaries[i + 1]] == g
+                    for i, g in enumerate(substring_graphemes, first)
+                )
+            ):
+                return True
+            index = string.find(substring, index + 1)
+        return False
 
     def safe_split_index(self, max_length: int) -> int:
         """
@@ -137,7 +249,8 @@ class GraphemeString:
         This function does normally not traverse the full grapheme sequence up to the given length, so it can be used
         for arbitrarily long strings and high `max_len`s. However, some grapheme boundaries depend on the previous state,
         so the worst case performance is O(n). In practice, it's only very long non-broken sequences of country flags
-        (represented as Regional Indicators) that will perform badly.
+        (represented as Regional Indicators) that will perform badly. If the grapheme boundaries were already cached
+        by `length`, `slice` or `graphemes`, they are searched with a binary search instead.
 
         The return value will always be between `0` and `len(string)`.
 
@@ -152,7 +265,11 @@ class GraphemeString:
         'நி (ni)'
         ```
         """
-        return grapheme.safe_split_index(self.string, max_length)
+        boundaries = self._cached_boundaries()
+        if boundaries is None:
+            # Unlike segmenting the whole string, this only looks at the graphemes around `max_length`.
+            return grapheme.safe_split_index(self.string, max_length)
+        return boundaries[max(bisect_right(boundaries, max_length) - 1, 0)]
 
     def startswith(self, prefix: str) -> bool:
         """
@@ -192,6 +309,67 @@ class GraphemeString:
     def __repr__(self) -> str:
         return self.__str__()
 
+    def __len__(self) -> int:
+        """
+        Returns the number of graphemes in the string, see `length`.
+
+        ``` python
+        >>> len(GraphemeString("🏳️‍🌈"))
+        1
+        ```
+        """
+        return self.length
+
+    def __bool__(self) -> bool:
+        """
+        Instances are always truthy, as they were before `__len__` was added, even for an empty string.
+        """
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the graphemes of the string, see `graphemes`.
+        """
+        return self.graphemes
+
+    def __getitem__(self: GraphemeStringT, index: Union[int, slice]):
+        """
+        Indexes the string by graphemes instead of codepoints.
+
+        An integer index returns the grapheme at that position as a `str`, and a slice returns a new instance of the
+        same class. Negative indices and slice steps are supported, as they are for `str`. The grapheme boundaries are
+        cached (see `length`), so indexing the same string again is O(1).
+
+        ``` python
+        >>> string = GraphemeString("tamil நி (ni)")
+        >>> string[6]
+        'நி'
+        >>> string[-4:]
+        (ni)
+        ```
+        """
+        boundaries = self._boundaries()
+        length = len(boundaries) - 1
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            if step == 1:
+                substring = self.string[
+                    boundaries[start] : boundaries[max(start, stop)]
+                ]
+            else:
+                substring = "".join(
+                    self.string[boundaries[i] : boundaries[i + 1]]
+                    for i in range(start, stop, step)
+                )
+            return type(self)(substring)
+
+        index = operator.index(index)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        return self.string[boundaries[index] : boundaries[index + 1]]
+
     def __add__(self, other) -> GraphemeStringT:
         return GraphemeString(self.string + str(other))
 
@@ -1,30 +1,58 @@
-import unicodedata
-from functools import reduce
-from typing import List, Optional, TypeVar, Dict, Callable, Tuple
-from operator import add
+import functools
+import re
+from typing import (
+    List,
+    Optional,
+    TypeVar,
+    Dict,
+    Callable,
+    Tuple,
+    Iterable,
+    Iterator,
+    Union,
+)
 
 from hebrew.numerical_conversion.substitute import Substitutions
 
 from .grapheme_string import GraphemeString
 from .chars import (
     MAQAF,
-    NIQQUD_CHARS,
-    TAAMIM_CHARS,
     PASEQ,
     SOF_PASSUK,
-    _NON_LETTER_CHARS,
+    HebrewChar,
+)
+
+# Not used here since the removals moved to `cleaner`, but `hebrew/__init__.py` star imports this module, so they are
+# kept to not break `from hebrew import CHARS` and the like.
+from .chars import (  # noqa: F401
+    NIQQUD_CHARS,
+    TAAMIM_CHARS,
     CHARS,
     HEBREW_CHARS,
     FINAL_MINOR_LETTER_MAPPINGS,
-    HebrewChar,
     SPECIAL_CHARACTER_NORMALIZED_MAPPING,
     YiddishChar,
 )
+from .cleaner import (
+    Cleaner,
+    _get_cleaner,
+    _is_normalized,
+    _normalize,
+    _remove_chars,
+    _NIQQUD_REMOVALS,
+    _TAAMIM_REMOVALS,
+    _TEXT_ONLY_REMOVALS,
+)
 from .numerical_conversion.convert import number_to_hebrew_string
-from hebrew.gematria import GematriaTypes
+from .tokenizer import Token, tokenize
+from hebrew.gematria import GematriaTypes, calculate_gematria, calculate_gematria_all
 
 HebrewT = TypeVar("HebrewT", bound="Hebrew")
 
+# Words as split by `str.split`, whose whitespace is the same as `\s`. Maqafs are also split on when requested.
+_WORD = re.compile(r"\S+")
+_WORD_SPLIT_MAQAF = re.compile(rf"[^\s{MAQAF.char}]+")
+
 
 def get_hebrew_name(letter: HebrewChar, name_dict) -> str:
     """
@@ -54,6 +82,8 @@ class Hebrew(GraphemeString):
     A `Hebrew` string can contain pure Hebrew letters, or can be composed of any additional characters.
     """
 
+    __slots__ = ()
+
     def __init__(self, string: str):
         super().__init__(string)
 
@@ -82,16 +112,68 @@ class Hebrew(GraphemeString):
         """
         return Hebrew(self.string.replace(SOF_PASSUK.char, ""))
 
-    def words(self, split_maqaf: bool = False) -> List[HebrewT]:
+    def words(
+        self,
+        split_maqaf: bool = False,
+        pool: Optional[Callable[[str], HebrewT]] = None,
+    ) -> List[HebrewT]:
         """
         Splits the string into a list of words.
 
         :param split_maqaf: Whether to split a single word such as "עַל־פְּנֵ֥י" into "עַל" and "פְּנֵי" when a maqaf is encountered.
+        :param pool: A `hebrew.pool.HebrewPool` to get the words from, so that repeated words share a single
+        `FrozenHebrew` instance. By default, a new `Hebrew` instance is created for each word.
         :return:
         """
         string = self.string if not split_maqaf else self.no_maqaf().string
+        if pool is not None:
+            return [pool(s) for s in string.split()]
         return [Hebrew(s) for s in string.split()]
 
+    def iter_words(
+        self,
+        split_maqaf: bool = False,
+        as_str: bool = False,
+        with_offsets: bool = False,
+        pool: Optional[Callable[[str], HebrewT]] = None,
+    ) -> Iterator[Union[HebrewT, str, Tuple[int, int, Union[HebrewT, str]]]]:
+        """
+        Lazily yields the words of the string, splitting it the same way as `words`.
+
+        Unlike `words`, no list (or intermediate string when splitting on maqafs) is created, so a long text can be
+        streamed into later processing steps one word at a time.
+
+        ``` python
+        >>> list(Hebrew("עַל־פְּנֵי הַמָּיִם").iter_words(split_maqaf=True, as_str=True, with_offsets=True))
+        [(0, 3, 'עַל'), (4, 10, 'פְּנֵי'), (11, 19, 'הַמָּיִם')]
+        ```
+
+        :param split_maqaf: Whether to split a single word such as "עַל־פְּנֵי" into "עַל" and "פְּנֵי" when a maqaf is
+        encountered.
+        :param as_str: Whether to yield each word as a plain `str` instead of a `Hebrew` instance.
+        :param with_offsets: Whether to yield a tuple of the start and end offsets of each word (in codepoints of the
+        string) along with the word.
+        :param pool: A `hebrew.pool.HebrewPool` to get the words from, see `words`. Ignored when `as_str` is True.
+        :return: An iterator of the words, or of `(start, end, word)` tuples if `with_offsets` is True.
+        """
+        pattern = _WORD_SPLIT_MAQAF if split_maqaf else _WORD
+        make = str if as_str else pool if pool is not None else Hebrew
+        if with_offsets:
+            return (
+                (m.start(), m.end(), make(m.group()))
+                for m in pattern.finditer(self.string)
+            )
+        return (make(m.group()) for m in pattern.finditer(self.string))
+
+    def tokenize(self) -> List[Token]:
+        """
+        Splits the string into words, along with their offsets and the kind of separator (space, maqaf, paseq or sof
+        passuk) that follows each one. See `hebrew.tokenizer.tokenize`.
+
+        :return: A list of `Token`s.
+        """
+        return list(tokenize(self.string))
+
     def text_only(self, remove_maqaf: bool = False) -> HebrewT:
         """
         Returns a string with all non-letter characters removed.
@@ -100,14 +182,11 @@ class Hebrew(GraphemeString):
         :param remove_maqaf: Whether to remove the maqaf characters if they are encountered
         :return:
         """
-        string = self.no_maqaf().string if remove_maqaf else self.string
-        chars_to_remove = [c.char for c in _NON_LETTER_CHARS if c not in (MAQAF, PASEQ)]
+        string = self.string.replace(MAQAF.char, " ") if remove_maqaf else self.string
         string = string.replace(
             f" {PASEQ.char} ", " "
         )  # Handled separately to avoid double spaces.
-        for char in chars_to_remove:
-            string = string.replace(char, "")
-        return Hebrew(string)
+        return Hebrew(_remove_chars(string, _TEXT_ONLY_REMOVALS))
 
     def no_niqqud(self) -> HebrewT:
         """
@@ -116,10 +195,7 @@ class Hebrew(GraphemeString):
 
         :return:
         """
-        string = self.string
-        for char in [c.char for c in NIQQUD_CHARS]:
-            string = string.replace(char, "")
-        return Hebrew(string)
+        return Hebrew(_remove_chars(self.string, _NIQQUD_REMOVALS))
 
     def normalize(self, normalize_yiddish: bool = False) -> HebrewT:
         """
@@ -131,27 +207,21 @@ class Hebrew(GraphemeString):
         :param normalize_yiddish: By default, yiddish characters are left alone since they are typically desired.
         :return:
         """
-        normalized = unicodedata.normalize("NFC", self.string)
-        # normalized = self.string
-        special_chars: dict = (
-            SPECIAL_CHARACTER_NORMALIZED_MAPPING
-            if normalize_yiddish
-            else {
-                k: v
-                for k, v in SPECIAL_CHARACTER_NORMALIZED_MAPPING.items()
-                if not isinstance(k, YiddishChar)
-            }
-        )
-        special_chars = {
-            k.char: "".join([val.char for val in v]) if isinstance(v, list) else v.char
-            for k, v in special_chars.items()
-        }
-        if any(char in normalized for char in special_chars):
-            for k, v in special_chars.items():
-                normalized = normalized.replace(k, v)
+        normalized = _normalize(self.string, normalize_yiddish)
         self.string = normalized
         return self
 
+    def is_normalized(self, normalize_yiddish: bool = False) -> bool:
+        """
+        Returns True if the string has no characters that would be changed by `normalize`.
+
+        This is much faster than normalizing, and can be used to skip strings that do not need to be normalized.
+
+        :param normalize_yiddish: Whether yiddish characters should be considered as needing to be normalized.
+        :return:
+        """
+        return _is_normalized(self.string, normalize_yiddish)
+
     def no_taamim(
         self, remove_maqaf: bool = False, remove_sof_passuk: bool = False
     ) -> HebrewT:
@@ -163,17 +233,54 @@ class Hebrew(GraphemeString):
         :param remove_sof_passuk: Whether to remove the remove_sof_passuk character if they are encountered.
         :return:
         """
-        string = self.no_maqaf().string if remove_maqaf else self.string
-        string = Hebrew(string).no_sof_passuk().string if remove_sof_passuk else string
-        chars_to_remove = [
-            p.char for p in TAAMIM_CHARS if p not in (MAQAF, PASEQ, SOF_PASSUK)
-        ]
+        string = self.string.replace(MAQAF.char, " ") if remove_maqaf else self.string
+        string = string.replace(SOF_PASSUK.char, "") if remove_sof_passuk else string
         string = string.replace(
             f" {PASEQ.char} ", " "
         )  # Handled separately to avoid double spaces.
-        for char in chars_to_remove:
-            string = string.replace(char, "")
-        return Hebrew(string)
+        return Hebrew(_remove_chars(string, _TAAMIM_REMOVALS))
+
+    def clean(
+        self,
+        normalize: bool = False,
+        normalize_yiddish: bool = False,
+        no_maqaf: bool = False,
+        no_sof_passuk: bool = False,
+        no_taamim: bool = False,
+        no_niqqud: bool = False,
+        text_only: bool = False,
+    ) -> HebrewT:
+        """
+        Applies several cleaning methods at once, returning a single new `Hebrew` instance.
+
+        ``` python
+        >>> Hebrew("וַֽיְהִי־עֶ֥רֶב").clean(no_maqaf=True, no_taamim=True, no_niqqud=True)
+        ויהי ערב
+        ```
+
+        This is equivalent to chaining the methods, without creating an intermediate instance for each step.
+        To clean many strings with the same options, create a `Cleaner` once and call it on each string.
+        See `Cleaner` for the order in which the steps are applied.
+
+        :param normalize: Whether to normalize special characters, see `normalize`.
+        :param normalize_yiddish: When normalizing, whether to normalize yiddish characters as well.
+        :param no_maqaf: Whether to replace maqafs with spaces, see `no_maqaf`.
+        :param no_sof_passuk: Whether to remove sof passuk characters, see `no_sof_passuk`.
+        :param no_taamim: Whether to remove ta'amim, see `no_taamim`.
+        :param no_niqqud: Whether to remove niqqud, see `no_niqqud`.
+        :param text_only: Whether to remove all non-letter characters, see `text_only`.
+        :return:
+        """
+        cleaner: Cleaner = _get_cleaner(
+            normalize,
+            normalize_yiddish,
+            no_maqaf,
+            no_sof_passuk,
+            no_taamim,
+            no_niqqud,
+            text_only,
+        )
+        return Hebrew(cleaner(self.string))
 
     def gematria(
         self,
@@ -190,115 +297,24 @@ class Hebrew(GraphemeString):
         that should be used to make the calculation. Eg: `{"ו": "ואו"}`.
         :return:
         """
-        # Remove non hebrew characters
-        cleaned_string: str = "".join(
-            [c for c in self.string if c in [x.char for x in HEBREW_CHARS] or c == " "]
-        )
+        return calculate_gematria(self.string, method, alt_letter_name_spelling)
 
-        if method == GematriaTypes.MISPAR_MUSAFI:
-            # Mispar Musafi (Heb: מספר מוספי) adds the number of letters in the word or phrase to the value.
-            value = self.__calculate_simple_gematria(cleaned_string)
-            hebrew_letters = [c for c in cleaned_string if c != " "]
-            return value + len(hebrew_letters)
-
-        elif method == GematriaTypes.MISPAR_KOLEL:
-            # Mispar Kolel (Heb: מספר כלל) is the value plus the number of words in the phrase.
-            value = self.__calculate_simple_gematria(cleaned_string)
-            hebrew_words = cleaned_string.split()
-            return value + len(hebrew_words)
-
-        elif method == GematriaTypes.MISPAR_BONEEH:
-            # Mispar Bone'eh (building value) (Heb: מספר בונה) adds the value of all previous letters in the word to the
-            # value of the current letter as the word is calculated. (ex. Echad is 1 + (1 + 8) + (1 + 8 + 4) = 23).
-            values = [
-                self.__calculate_simple_gematria(c)
-                for c in [x for x in cleaned_string if x != " "]
-            ]
-            total = 0
-            for i, n in enumerate(values):
-                total += sum(values[:i]) + n
-            return total
-
-        elif method == GematriaTypes.MISPAR_HAMERUBAH_HAKLALI:
-            # Mispar HaMerubah HaKlali (Heb: מספר המרובע הכללי) is the standard value squared.
-            return self.__calculate_simple_gematria(cleaned_string) ** 2
-
-        elif method == GematriaTypes.MISPAR_HAACHOR:
-            # Mispar Ha'achor (sometimes called Mispar Meshulash, triangular value) (Heb: מספר האחור) values each letter
-            # as its value multiplied by the position of the letter in the word or phrase.
-            values = [
-                self.__calculate_simple_gematria(c)
-                for c in [x for x in cleaned_string if x != " "]
-            ]
-            total = 0
-            for i, n in enumerate(values):
-                total += n * (i + 1)
-            return total
-
-        elif method == GematriaTypes.MISPAR_KATAN_MISPARI:
-            # Mispar Katan Mispari (integral reduced value) (Heb: מספר קטן מספרי) is the digital root of the standard
-            # value which is obtained by adding all the digits in the number until the number is a single digit.
-            # (ex. Echad (13) --> 1 + 3 --> 4).
-            calculated_value = self.__calculate_simple_gematria(cleaned_string)
-            while calculated_value > 9:
-                calculated_value = sum([int(x) for x in str(calculated_value)])
-            return calculated_value
-
-        elif method == GematriaTypes.MISPAR_SHEMI_MILUI:
-            # Mispar Shemi (Milui, full name value) (Heb: מספר שמי\מילוי) values each letter as the value of the
-            # letter's name. (ex. "Aleph" = Aleph + Lamed + Fey = 1 + 30 + 80 = 111).
-            # [Note: There is more than one way to spell certain letters.]
-
-            # Get list of HebrewChar instances for each letter in string
-            chars: List[HebrewChar] = [
-                CHARS[c] for c in [x for x in cleaned_string if x != " "]
-            ]
-
-            # Convert final letters to non-final since our internal lib naming for final letters
-            # will ruin the calculation.
-            replaced_final_letters = [
-                CHARS[FINAL_MINOR_LETTER_MAPPINGS.get(c.char)] if c.final_letter else c
-                for c in chars
-            ]
-
-            # Get internal or user supplied names, and calculate value off them.
-            values = [
-                self.__calculate_simple_gematria(
-                    get_hebrew_name(c, alt_letter_name_spelling)
-                )
-                for c in replaced_final_letters
-            ]
-            return sum(values)
-
-        elif method == GematriaTypes.MISPAR_NEELAM:
-            # Mispar Ne'elam (hidden value) (Heb: מספר נעלם) values each letter as the value of the letter's name
-            # without the letter itself. (ex. "Aleph" = Lamed + Fey = 30 + 80 = 110).
-
-            # Get list of HebrewChar instances for each letter in string
-            chars: List[HebrewChar] = [
-                CHARS[c] for c in [x for x in cleaned_string if x != " "]
-            ]
-
-            # Convert final letters to non-final since our internal lib naming for final letters
-            # will ruin the calculation.
-            replaced_final_letters = [
-                CHARS[FINAL_MINOR_LETTER_MAPPINGS.get(c.char)] if c.final_letter else c
-                for c in chars
-            ]
-
-            # Get internal or user supplied names.
-            names = [
-                get_hebrew_name(c, alt_letter_name_spelling)
-                for c in replaced_final_letters
-            ]
-
-            # Remove letter from name and calculate value
-            values = [self.__calculate_simple_gematria(c[1:]) for c in names]
-            return sum(values)
-
-        else:
-            # Simple gematria that can be calculated by simply adding each letters value up to a final number.
-            return self.__calculate_simple_gematria(self.string, method)
+    def gematria_all(
+        self,
+        methods: Optional[Iterable[GematriaTypes]] = None,
+        alt_letter_name_spelling: Dict[str, str] = None,
+    ) -> Dict[GematriaTypes, int]:
+        """
+        Returns the gematria of the string for several methods at once.
+
+        The string is only cleaned and traversed once, making this much faster than calling `gematria` for each method.
+
+        :param methods: The methods to calculate. When None, all methods in `GematriaTypes` are calculated.
+        :param alt_letter_name_spelling: Used only with MISPAR_SHEMI_MILUI: A dict of alternate spellings for a letter
+        that should be used to make the calculation. Eg: `{"ו": "ואו"}`.
+        :return: A dict with each requested method as a key, and the gematria for that method as its value.
+        """
+        return calculate_gematria_all(self.string, methods, alt_letter_name_spelling)
 
     @classmethod
     def from_number(
@@ -325,16 +341,99 @@ class Hebrew(GraphemeString):
             number_to_hebrew_string(number, punctuate, geresh, substitution_functions)
         )
 
-    @staticmethod
-    def __calculate_simple_gematria(
-        string: str, method: GematriaTypes = GematriaTypes.MISPAR_HECHRACHI
-    ) -> int:
-        """Calculate Gematria for simple Gematria that use a value map for each letter."""
-        chars = [
-            CHARS[c] for c in string if CHARS.get(c) and hasattr(CHARS[c], method.value)
-        ]
-        if len(chars) == 0:
-            # The list will be 0 if there are no letters in the string or if the letters are not hebrew.
-            return 0
-        else:
-            return reduce(add, [getattr(c, method.value) for c in chars])
+
+def _cached_view(method: Callable) -> Callable:
+    """
+    Wraps a `Hebrew` method so that `FrozenHebrew` computes its result once per instance and set of arguments.
+
+    `Hebrew` results are converted to the frozen class so that chained calls are cached as well. Calls with unhashable
+    arguments (such as an `alt_letter_name_spelling` dict) are not cached.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(kwargs.items()))
+        try:
+            return _copy_view(self._cache[key])
+        except KeyError:
+            pass
+        except TypeError:
+            return _freeze_view(type(self), method(self, *args, **kwargs))
+        result = self._cache[key] = _freeze_view(
+            type(self), method(self, *args, **kwargs)
+        )
+        return _copy_view(result)
+
+    return wrapper
+
+
+def _freeze_view(cls, result):
+    """Converts a result of a `Hebrew` method to use the frozen class `cls`."""
+    if isinstance(result, Hebrew) and not isinstance(result, cls):
+        return cls(result.string)
+    if isinstance(result, list):
+        return tuple(_freeze_view(cls, r) for r in result)
+    return result
+
+
+def _copy_view(result):
+    """Returns a cached result, copying mutable results so that the cache can not be changed by the caller."""
+    if isinstance(result, tuple):
+        return list(result)
+    if isinstance(result, dict):
+        return dict(result)
+    return result
+
+
+class FrozenHebrew(Hebrew):
+    """
+    An immutable `Hebrew` string that caches the results of its methods.
+
+    `Hebrew.normalize` changes the string in place, so the results of a `Hebrew` instance's methods can't be cached.
+    A `FrozenHebrew` can't be changed, so each derived result (such as `text_only()`, `no_niqqud()`,
+    `gematria(method)` or `words()`) is computed once per instance and arguments, and returned from a cache after
+    that. Derived strings are `FrozenHebrew` instances themselves, so chained calls are cached as well.
+
+    ``` python
+    >>> hs = FrozenHebrew("בְּרֵאשִׁ֖ית בָּרָ֣א")
+    >>> hs.no_taamim().no_niqqud() is hs.no_taamim().no_niqqud()
+    True
+    >>> hs.normalize()  # Returns a new instance instead of changing hs.
+    בְּרֵאשִׁ֖ית בָּרָ֣א
+    ```
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self, string: str):
+        super().__init__(string)
+        self._cache: Dict[tuple, object] = {}
+
+    def __setattr__(self, name: str, value) -> None:
+        if name == "string" and hasattr(self, "string"):
+            raise AttributeError(f"{self.__class__.__name__} is immutable")
+        super().__setattr__(name, value)
+
+    no_maqaf = _cached_view(Hebrew.no_maqaf)
+    no_sof_passuk = _cached_view(Hebrew.no_sof_passuk)
+    words = _cached_view(Hebrew.words)
+    tokenize = _cached_view(Hebrew.tokenize)
+    text_only = _cached_view(Hebrew.text_only)
+    no_niqqud = _cached_view(Hebrew.no_niqqud)
+    is_normalized = _cached_view(Hebrew.is_normalized)
+    no_taamim = _cached_view(Hebrew.no_taamim)
+    clean = _cached_view(Hebrew.clean)
+    gematria = _cached_view(Hebrew.gematria)
+    gematria_all = _cached_view(Hebrew.gematria_all)
+
+    @_cached_view
+    def normalize(self, normalize_yiddish: bool = False) -> HebrewT:
+        """
+        Returns the string with all non-standard hebrew characters replaced, see `Hebrew.normalize`.
+
+        Unlike `Hebrew.normalize`, the instance is not changed and a new instance is returned.
+
+        :param normalize_yiddish: By default, yiddish characters are left alone since they are typically desired.
+        :return:
+        """
+        return Hebrew(_normalize(self.string, normalize_yiddish))
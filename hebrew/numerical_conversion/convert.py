@@ -1,11 +1,53 @@
-from typing import Optional, Callable, Tuple
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Callable, Tuple
 
-from hebrew.numerical_conversion.substitute import Substitutions
+from hebrew.numerical_conversion.substitute import (
+    CompiledSubstitutions,
+    Substitutions,
+)
 from hebrew.numerical_conversion.mappings import (
     HEBREW_LETTER_TO_VALUE_MAPPINGS,
+    HEBREW_LETTER_VALUES,
     STANDARD_HEBREW_LETTERS_VALUES_REVERSED,
 )
 
+# A geresh that is followed by more letters separates a thousands group from the rest of the number, as in "ה׳תשפ״ד".
+# Two gereshes in a row are a gershayim, which scanned documents often have instead of the single character.
+_THOUSANDS_SEPARATOR = re.compile(r"(?<![׳'])[׳'](?![׳'])\s*(?=\S)")
+_REMOVE_PUNCTUATION = str.maketrans("", "", "׳'״\"")
+
+_DEFAULT_CACHE_LIMIT = 1000
+_cache_limit = _DEFAULT_CACHE_LIMIT
+# The memoized results of `number_to_hebrew_string` for each (punctuate, geresh, substitution_functions), indexed by
+# number.
+_cache: Dict[tuple, List[Optional[str]]] = {}
+# Each distinct tuple of substitution functions gets its own table, so tuples of functions created on every call
+# would otherwise grow the cache without a bound.
+_MAX_CACHED_OPTIONS = 64
+
+
+def set_number_cache_limit(limit: int = _DEFAULT_CACHE_LIMIT) -> None:
+    """
+    Sets the largest number whose Hebrew form is memoized by `number_to_hebrew_string`, and clears the memoized forms.
+
+    Numbers from 1 up to the limit (1000 by default) are only converted once for each combination of `punctuate`,
+    `geresh` and `substitution_functions`, and later calls return the memoized string. Larger numbers are always
+    converted.
+
+    ``` python
+    >>> set_number_cache_limit(6000)  # Also memoize years, such as "ה׳תשפ״ד".
+    >>> set_number_cache_limit(0)  # Disable memoization.
+    ```
+
+    :param limit: The largest number to memoize. 0 disables memoization.
+    """
+    global _cache_limit
+    if limit < 0:
+        raise ValueError(f"The limit must not be negative, got {limit}")
+    _cache_limit = limit
+    _cache.clear()
+
 
 def number_to_hebrew_string(
     number: int,
@@ -26,6 +68,38 @@ def number_to_hebrew_string(
     values such as שמד ,רע, and others, use `Substitutions.ALL`.
     :return:
     """
+    # Most numbers converted are small (chapters, verses and pages), so they are memoized, see `set_number_cache_limit`.
+    if type(number) is int and 0 < number <= _cache_limit:
+        try:
+            table = _cache.get((punctuate, geresh, substitution_functions))
+        except TypeError:
+            # Unhashable substitution functions, such as a list, can't be memoized.
+            table = None
+        else:
+            if table is None and len(_cache) < _MAX_CACHED_OPTIONS:
+                table = _cache[(punctuate, geresh, substitution_functions)] = [None] * (
+                    _cache_limit + 1
+                )
+        # The limit may have been lowered since the table was created.
+        if table is not None and number < len(table):
+            result = table[number]
+            if result is None:
+                result = table[number] = _number_to_hebrew_string(
+                    number, punctuate, geresh, substitution_functions
+                )
+            return result
+    return _number_to_hebrew_string(number, punctuate, geresh, substitution_functions)
+
+
+def _number_to_hebrew_string(
+    number: int,
+    punctuate: bool,
+    geresh: bool,
+    substitution_functions: Optional[Tuple[Callable[[str], str], ...]],
+) -> str:
+    """
+    Converts a number into its Hebrew letter form, without memoization. See `number_to_hebrew_string`.
+    """
     # Handle 0
     if number < 1:
         raise ValueError("Number must be greater than 0")
@@ -48,8 +122,14 @@ def number_to_hebrew_string(
 
     # Substitute flags
     if substitution_functions:
-        for func in substitution_functions:
-            result = func(result)
+        try:
+            substitute = _compiled_substitutions(substitution_functions)
+        except TypeError:
+            # Unhashable substitution functions, such as a list, are applied one by one.
+            for func in substitution_functions:
+                result = func(result)
+        else:
+            result = substitute(result)
 
     # Add Punctuation
     if punctuate:
@@ -63,6 +143,48 @@ def number_to_hebrew_string(
     return result
 
 
+def hebrew_string_to_number(string: str) -> int:
+    """
+    Convert a number in its Hebrew letter form back into an int. This is the reverse of `number_to_hebrew_string`.
+
+    The letters of the number are summed using a precomputed table of letter values, so the order of the letters
+    doesn't matter and all of the substitutions in `Substitutions.ALL` (such as "טו", "טז" and "רחצ") are parsed. The
+    punctuation may be a geresh and gershayim, their ASCII equivalents (`'` and `"`), or missing. A geresh followed by
+    more letters marks the letters before it as thousands, so "ה׳תשפ״ד" is parsed as 5784.
+
+    ``` python
+    >>> hebrew_string_to_number("תשפ״ד")
+    784
+    >>> hebrew_string_to_number("ה'תשפ\\"ד")
+    5784
+    >>> hebrew_string_to_number("ט״ו")
+    15
+    ```
+
+    :param string: The Hebrew number to convert. Surrounding whitespace is ignored.
+    :return: The value of the number.
+    """
+    number = 0
+    for group in _THOUSANDS_SEPARATOR.split(string.strip()):
+        letters = group.translate(_REMOVE_PUNCTUATION)
+        try:
+            value = sum(map(HEBREW_LETTER_VALUES.__getitem__, letters))
+        except KeyError:
+            value = 0
+        if not value:
+            raise ValueError(f"{string!r} is not a number in Hebrew letters")
+        number = number * 1000 + value
+    return number
+
+
+@lru_cache(maxsize=64)
+def _compiled_substitutions(
+    substitution_functions: Tuple[Callable[[str], str], ...]
+) -> CompiledSubstitutions:
+    """Returns the substitution functions compiled into a single callable, compiling each tuple only once."""
+    return CompiledSubstitutions(substitution_functions)
+
+
 def _ones_column_value(number: int):
     """
     Return the value of the ones column of a number.
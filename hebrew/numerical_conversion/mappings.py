@@ -58,3 +58,13 @@ HEBREW_LETTER_TO_VALUE_MAPPINGS = dict(
     zip(_STANDARD_HEBREW_LETTERS_VALUES, _STANDARD_HEBREW_LETTERS)
 )
 "Dictionary mapping standard Hebrew letters to their values."
+
+HEBREW_LETTER_VALUES = {
+    **dict(zip(_STANDARD_HEBREW_LETTERS, _STANDARD_HEBREW_LETTERS_VALUES)),
+    "ך": 20,
+    "ם": 40,
+    "ן": 50,
+    "ף": 80,
+    "ץ": 90,
+}
+"Dictionary mapping Hebrew letters, including final letters, to their values."
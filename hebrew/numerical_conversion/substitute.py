@@ -1,25 +1,179 @@
 import re
-from typing import Callable
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 
+class SubstitutionRule(NamedTuple):
+    """
+    A substitution that replaces the end of a value, or the whole value, with an equivalent.
+    """
+
+    bad: str
+    """The letters to replace."""
+    good: str
+    """The letters to replace them with."""
+    whole: bool = False
+    """Whether `bad` must be the whole value, rather than only its end."""
+
+    def matches(self, value: str) -> bool:
+        """Returns whether the rule applies to the value."""
+        return value == self.bad if self.whole else value.endswith(self.bad)
+
+
+# Patterns that only match the end of a value ("רע$") or the whole value ("^רעה$"), which are all the patterns used
+# by the substitution functions here.
+_ANCHORED_LETTERS = re.compile(r"(\^?)([א-ת]+)\$")
+
+
+def _rule_from_pattern(pattern: str, good: str) -> Optional[SubstitutionRule]:
+    """Returns the rule equivalent to `re.sub(pattern, good, value)`, or None if the pattern isn't a simple one."""
+    match = _ANCHORED_LETTERS.fullmatch(pattern)
+    if match is None or "\\" in good:
+        return None
+    return SubstitutionRule(match.group(2), good, whole=bool(match.group(1)))
+
+
+def _substitutes(pattern: str, good: str) -> Callable:
+    """
+    Marks a substitution function with the rule it applies, so that `CompiledSubstitutions` can merge it with others.
+    """
+
+    def decorator(func: Callable[[str], str]) -> Callable[[str], str]:
+        func.substitution_rule = _rule_from_pattern(pattern, good)
+        return func
+
+    return decorator
+
+
+_YUD_HEY = re.compile(r"יה$")
+_YUD_VAV = re.compile(r"יו$")
+
+
+@_substitutes(_YUD_HEY.pattern, "טו")
 def yud_hey_to_tes_vav(value: str) -> str:
     """Used to substitute 'יה' for 'טו' in a string"""
-    return re.sub(r"יה$", "טו", value)
+    return _YUD_HEY.sub("טו", value)
 
 
+@_substitutes(_YUD_VAV.pattern, "טז")
 def yud_vav_to_tes_zayen(value: str) -> str:
     """Used to substitute 'יו' for 'טז' in a string"""
-    return re.sub(r"יו$", "טז", value)
+    return _YUD_VAV.sub("טז", value)
 
 
 def _get_word_substitution_func(bad: str, good: str) -> Callable[[str], str]:
+    pattern = re.compile(bad)
+
+    @_substitutes(bad, good)
     def word_substitution_func(value: str) -> str:
         """Substitute the first word for the second word"""
-        return re.sub(bad, good, value)
+        return pattern.sub(good, value)
 
     return word_substitution_func
 
 
+class CompiledSubstitutions:
+    """
+    A tuple of substitution functions compiled into a single callable, which gives the same result as calling each of
+    the functions in order.
+
+    The functions in `Substitutions` each replace the end of a value (or the whole value) using a regular expression.
+    When none of them can match a value that another one matches or produces, at most one of them applies to any value,
+    so they are merged into a single lookup of the value and its endings. Other callables, and functions whose rules
+    overlap, are called in order as usual.
+
+    ``` python
+    >>> substitute = CompiledSubstitutions(Substitutions.ALL)
+    >>> substitute("רע"), substitute("תשמד"), substitute("יה")
+    ('ער', 'תשדמ', 'טו')
+    ```
+    """
+
+    def __init__(self, functions: Iterable[Callable[[str], str]]):
+        """
+        :param functions: The substitution functions to apply, in order. See `Substitutions`.
+        """
+        self.functions: Tuple[Callable[[str], str], ...] = tuple(functions)
+        steps: List[Callable[[str], str]] = []
+        rules: List[SubstitutionRule] = []
+        run: List[Callable[[str], str]] = []
+        # A trailing None ends the last run of rules.
+        for func in self.functions + (None,):
+            rule = getattr(func, "substitution_rule", None)
+            if rule is not None:
+                rules.append(rule)
+                run.append(func)
+                continue
+            if rules:
+                if _rules_overlap(rules):
+                    steps.extend(run)
+                else:
+                    steps.append(_lookup(rules))
+                rules, run = [], []
+            if func is not None:
+                steps.append(func)
+        self._steps = tuple(steps)
+
+    def __call__(self, value: str) -> str:
+        for step in self._steps:
+            value = step(value)
+        return value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.functions!r})"
+
+
+def _rules_overlap(rules: List[SubstitutionRule]) -> bool:
+    """
+    Returns whether applying the rules in order could differ from applying only the rule that matches the value:
+    when two rules can match the same value, or when a rule can match the result of an earlier one.
+    """
+    for i, earlier in enumerate(rules):
+        for later in rules[i + 1 :]:
+            if earlier.whole and later.whole:
+                both_match = earlier.bad == later.bad
+            elif earlier.whole or later.whole:
+                whole, suffix = (earlier, later) if earlier.whole else (later, earlier)
+                both_match = whole.bad.endswith(suffix.bad)
+            else:
+                both_match = earlier.bad.endswith(later.bad) or later.bad.endswith(
+                    earlier.bad
+                )
+            if earlier.whole:
+                rematch = later.matches(earlier.good)
+            elif later.whole:
+                rematch = later.bad.endswith(earlier.good)
+            else:
+                rematch = earlier.good.endswith(later.bad) or later.bad.endswith(
+                    earlier.good
+                )
+            if both_match or rematch:
+                return True
+    return False
+
+
+def _lookup(rules: List[SubstitutionRule]) -> Callable[[str], str]:
+    """Returns a function that applies whichever of the non overlapping rules matches the value."""
+    whole: Dict[str, str] = {r.bad: r.good for r in rules if r.whole}
+    endings: Dict[str, str] = {r.bad: r.good for r in rules if not r.whole}
+    lengths = sorted({len(bad) for bad in endings}, reverse=True)
+
+    def substitute(value: str) -> str:
+        # Like `$` in the rules' patterns, the end of the value is also just before a single trailing newline.
+        newline = "\n" if value.endswith("\n") else ""
+        if newline:
+            value = value[:-1]
+        good = whole.get(value)
+        if good is not None:
+            return good + newline
+        for length in lengths:
+            good = endings.get(value[-length:])
+            if good is not None:
+                return value[:-length] + good + newline
+        return value + newline
+
+    return substitute
+
+
 POLITE_WORD_MAP = {
     r"רע$": "ער",
     r"רעב$": "ערב",
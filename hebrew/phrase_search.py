@@ -0,0 +1,133 @@
+"""
+Finds the runs of consecutive words in a text whose gematria equals a target value.
+"""
+
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from .gematria import (
+    GematriaTypes,
+    _SIMPLE_GEMATRIA_VALUES,
+    calculate_gematria,
+)
+from .grapheme_string import GraphemeString
+
+# Methods where the gematria of a phrase is the sum of the gematria of its words. The rest depend on the position of
+# each letter in the phrase (MISPAR_BONEEH, MISPAR_HAACHOR) or on its total (MISPAR_HAMERUBAH_HAKLALI,
+# MISPAR_KATAN_MISPARI).
+_ADDITIVE_METHODS = frozenset(_SIMPLE_GEMATRIA_VALUES) | {
+    GematriaTypes.MISPAR_MUSAFI,
+    GematriaTypes.MISPAR_KOLEL,
+    GematriaTypes.MISPAR_SHEMI_MILUI,
+    GematriaTypes.MISPAR_NEELAM,
+}
+
+
+class PhraseMatch(NamedTuple):
+    """
+    A run of consecutive words whose gematria equals the searched value.
+    """
+
+    start: int
+    """The index of the first word of the phrase."""
+    end: int
+    """The index just past the last word of the phrase, so that the phrase is `words[start:end]`."""
+    phrase: str
+    """The words of the phrase, joined by spaces."""
+
+
+def iter_phrases_with_gematria(
+    words: Iterable[Union[str, GraphemeString]],
+    value: int,
+    method: GematriaTypes = GematriaTypes.MISPAR_HECHRACHI,
+    max_words: int = 10,
+    alt_letter_name_spelling: Optional[Dict[str, str]] = None,
+) -> Iterator[PhraseMatch]:
+    """
+    Yields every run of up to `max_words` consecutive words whose gematria equals the value, ordered by where the run
+    ends and then by where it starts.
+
+    The gematria of each distinct word is calculated once. Since the gematria of a phrase is the sum of the gematria of
+    its words, the phrases are found from the running total of the word values in a single pass over the words,
+    instead of calculating the gematria of every run of words.
+
+    ``` python
+    >>> list(iter_phrases_with_gematria("בְּרֵאשִׁית בָּרָא אֱלֹהִים אֵת".split(), 289))
+    [PhraseMatch(start=1, end=3, phrase='בָּרָא אֱלֹהִים')]
+    ```
+
+    :param words: The words of the text, such as `Hebrew(text).iter_words(as_str=True)`.
+    :param value: The gematria value to search for.
+    :param method: The gematria method to use. Only methods where the value of a phrase is the sum of the values of its
+    words are supported: the simple methods, MISPAR_MUSAFI, MISPAR_KOLEL, MISPAR_SHEMI_MILUI and MISPAR_NEELAM.
+    :param max_words: The maximum number of words in a phrase.
+    :param alt_letter_name_spelling: Used only with MISPAR_SHEMI_MILUI and MISPAR_NEELAM: A dict of alternate spellings
+    for a letter that should be used to make the calculation. Eg: `{"ו": "ואו"}`.
+    :return: An iterator of the matching phrases.
+    """
+    if method not in _ADDITIVE_METHODS:
+        raise ValueError(
+            f"{method} can not be searched by phrase, since the gematria of a phrase is not the sum of its words"
+        )
+    if max_words < 1:
+        raise ValueError(f"max_words must be positive, got {max_words}")
+    # The arguments are checked above, when the function is called, rather than when the phrases are first iterated.
+    return _iter_phrases(words, value, method, max_words, alt_letter_name_spelling)
+
+
+def _iter_phrases(
+    words: Iterable[Union[str, GraphemeString]],
+    value: int,
+    method: GematriaTypes,
+    max_words: int,
+    alt_letter_name_spelling: Optional[Dict[str, str]],
+) -> Iterator[PhraseMatch]:
+    """Yields the matching phrases, see `iter_phrases_with_gematria`."""
+    words = [str(w) for w in words]
+    word_values: Dict[str, int] = {}
+    for word in words:
+        if word not in word_values:
+            word_values[word] = calculate_gematria(
+                word, method, alt_letter_name_spelling
+            )
+    totals = list(accumulate(map(word_values.__getitem__, words), initial=0))
+
+    # Word values are never negative, so the running totals never decrease. For each last word, the phrases ending at
+    # it start at the indices whose total is `value` less than the total after it. These indices are contiguous, and
+    # they only move forward as the last word does, so they are tracked with two pointers.
+    low = high = 0
+    for last in range(len(words)):
+        needed = totals[last + 1] - value
+        while low <= last and totals[low] < needed:
+            low += 1
+        high = max(high, low)
+        while high <= last and totals[high] <= needed:
+            high += 1
+        for start in range(max(low, last + 1 - max_words), high):
+            yield PhraseMatch(start, last + 1, " ".join(words[start : last + 1]))
+
+
+def find_phrases_with_gematria(
+    words: Iterable[Union[str, GraphemeString]],
+    value: int,
+    method: GematriaTypes = GematriaTypes.MISPAR_HECHRACHI,
+    max_words: int = 10,
+    alt_letter_name_spelling: Optional[Dict[str, str]] = None,
+) -> List[PhraseMatch]:
+    """
+    Returns every run of up to `max_words` consecutive words whose gematria equals the value.
+    See `iter_phrases_with_gematria`.
+
+    :param words: The words of the text, such as `Hebrew(text).iter_words(as_str=True)`.
+    :param value: The gematria value to search for.
+    :param method: The gematria method to use.
+    :param max_words: The maximum number of words in a phrase.
+    :param alt_letter_name_spelling: Used only with MISPAR_SHEMI_MILUI and MISPAR_NEELAM: A dict of alternate spellings
+    for a letter that should be used to make the calculation. Eg: `{"ו": "ואו"}`.
+    :return: A list of the matching phrases.
+    """
+    return list(
+        iter_phrases_with_gematria(
+            words, value, method, max_words, alt_letter_name_spelling
+        )
+    )
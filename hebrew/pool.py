@@ -0,0 +1,100 @@
+"""
+A bounded pool of shared `FrozenHebrew` instances, so that words repeated across a corpus are only created once.
+"""
+
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Type
+
+from .hebrew_obj import FrozenHebrew
+
+
+class PoolInfo(NamedTuple):
+    """Usage statistics of a `HebrewPool`, like those returned by `functools.lru_cache`'s `cache_info()`."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class HebrewPool:
+    """
+    Returns a shared `FrozenHebrew` instance for each distinct string.
+
+    In real corpora the same few thousand words recur millions of times. Since a `FrozenHebrew` caches its cleaned
+    forms and gematria values, sharing one instance per word saves both the memory of the repeated objects and the
+    time spent recalculating their values.
+
+    The pool keeps up to `maxsize` instances, evicting the least recently used one when full.
+
+    ``` python
+    >>> pool = HebrewPool(maxsize=10_000)
+    >>> words = Hebrew("וַיְהִי עֶרֶב וַיְהִי בֹקֶר").words(pool=pool)
+    >>> words[0] is words[2]
+    True
+    >>> pool.cache_info()
+    PoolInfo(hits=1, misses=3, maxsize=10000, currsize=3)
+    ```
+    """
+
+    def __init__(
+        self, maxsize: Optional[int] = 65536, cls: Type[FrozenHebrew] = FrozenHebrew
+    ):
+        """
+        :param maxsize: The maximum number of instances kept in the pool. When None, the pool is not bounded.
+        :param cls: The class of the instances created by the pool.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, got {maxsize}")
+        self.maxsize = maxsize
+        self.cls = cls
+        self._instances: "OrderedDict[str, FrozenHebrew]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, string: str) -> FrozenHebrew:
+        """
+        Returns the shared instance for the string, creating it if it is not in the pool.
+
+        :param string: The string to get an instance for.
+        :return:
+        """
+        instances = self._instances
+        instance = instances.get(string)
+        if instance is not None:
+            self._hits += 1
+            instances.move_to_end(string)
+            return instance
+
+        self._misses += 1
+        instance = self.cls(string)
+        if self.maxsize != 0:
+            instances[string] = instance
+            if self.maxsize is not None and len(instances) > self.maxsize:
+                instances.popitem(last=False)
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __contains__(self, string: str) -> bool:
+        return string in self._instances
+
+    def cache_info(self) -> PoolInfo:
+        """
+        Returns the number of hits and misses of the pool, to help choose its `maxsize`.
+
+        :return:
+        """
+        return PoolInfo(self._hits, self._misses, self.maxsize, len(self._instances))
+
+    def clear(self) -> None:
+        """
+        Removes all instances from the pool and resets its statistics.
+        """
+        self._instances.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(maxsize={self.maxsize})"
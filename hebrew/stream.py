@@ -0,0 +1,118 @@
+"""
+Clean large texts, such as multi gigabyte dumps of vocalized text, chunk by chunk without loading them into memory.
+"""
+
+import os
+from typing import Iterator, TextIO, Union
+
+from .chars import PASEQ
+from .cleaner import Cleaner
+from .grapheme_string import GraphemeString
+
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+"""The number of characters read from the stream at a time."""
+
+# Cleaning may replace a paseq surrounded by spaces, so a chunk never ends on either of them.
+_UNSAFE_CHUNK_ENDS = (" ", PASEQ.char)
+
+
+def _safe_chunk_end(buffer: str) -> int:
+    """
+    Returns the index up to which the buffer can be cleaned without knowing what comes after it.
+
+    The buffer is split after its last line break when it has one. Otherwise, its last grapheme is held back, since the
+    next chunk may continue it with more niqqud or ta'amim, along with any spaces and paseqs before it.
+
+    :param buffer: The text read so far.
+    :return: The index to split the buffer at, `0` if no part of the buffer is safe to clean yet.
+    """
+    index = buffer.rfind("\n") + 1
+    if index:
+        return index
+    index = GraphemeString(buffer).safe_split_index(len(buffer) - 1)
+    while index and buffer[index - 1] in _UNSAFE_CHUNK_ENDS:
+        index -= 1
+    return index
+
+
+def iter_clean(
+    stream: TextIO, cleaner: Cleaner, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Reads a text stream in chunks and yields each chunk cleaned.
+
+    Chunks are never split in the middle of a grapheme, so the joined output is the same as cleaning the full text at
+    once.
+
+    ``` python
+    >>> import io
+    >>> cleaner = Cleaner(no_maqaf=True, no_taamim=True, no_niqqud=True)
+    >>> "".join(iter_clean(io.StringIO("וַֽיְהִי־עֶ֥רֶב\\nוַֽיְהִי־בֹ֖קֶר"), cleaner, chunk_size=4))
+    'ויהי ערב\\nויהי בקר'
+    ```
+
+    :param stream: The text stream to read from, such as a file opened in text mode.
+    :param cleaner: The `Cleaner` to apply to the text.
+    :param chunk_size: The number of characters to read from the stream at a time.
+    :return: An iterator of the cleaned chunks.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    buffer = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+        index = _safe_chunk_end(buffer)
+        if index:
+            yield cleaner(buffer[:index])
+            buffer = buffer[index:]
+    if buffer:
+        yield cleaner(buffer)
+
+
+def clean_stream(
+    source: TextIO,
+    destination: TextIO,
+    cleaner: Cleaner,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """
+    Cleans a text stream chunk by chunk, writing the result to another stream.
+
+    :param source: The text stream to read from.
+    :param destination: The text stream to write the cleaned text to.
+    :param cleaner: The `Cleaner` to apply to the text.
+    :param chunk_size: The number of characters to read from the stream at a time.
+    """
+    for cleaned in iter_clean(source, cleaner, chunk_size):
+        destination.write(cleaned)
+
+
+def clean_file(
+    source: Union[str, os.PathLike],
+    destination: Union[str, os.PathLike],
+    cleaner: Cleaner,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> None:
+    """
+    Cleans a text file chunk by chunk, writing the result to another file.
+
+    Line endings are kept as they are in the source file.
+
+    ``` python
+    >>> clean_file("genesis.txt", "genesis_clean.txt", Cleaner(normalize=True, no_taamim=True))  # doctest: +SKIP
+    ```
+
+    :param source: The path of the file to clean.
+    :param destination: The path to write the cleaned text to.
+    :param cleaner: The `Cleaner` to apply to the text.
+    :param chunk_size: The number of characters to read from the file at a time.
+    :param encoding: The encoding of both files.
+    """
+    with open(source, encoding=encoding, newline="") as source_file, open(
+        destination, "w", encoding=encoding, newline=""
+    ) as destination_file:
+        clean_stream(source_file, destination_file, cleaner, chunk_size)
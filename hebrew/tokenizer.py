@@ -0,0 +1,94 @@
+"""
+Splits Hebrew text into words along with their offsets and the kind of separator that follows each word.
+"""
+
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Iterator, NamedTuple
+
+from .chars import MAQAF, PASEQ, SOF_PASSUK
+
+
+class SeparatorKind(Enum):
+    """
+    The kind of separator that follows a word.
+    """
+
+    SPACE = "space"
+    MAQAF = "maqaf"
+    PASEQ = "paseq"
+    SOF_PASSUK = "sof_passuk"
+    # The word is the last one in the string.
+    END = "end"
+
+
+class Token(NamedTuple):
+    """
+    A word and its position in the string it was found in.
+    """
+
+    start: int
+    """The offset of the first codepoint of the word."""
+    end: int
+    """The offset just past the last codepoint of the word, so that `string[start:end] == word`."""
+    word: str
+    """The word, without the separator that follows it."""
+    separator: SeparatorKind
+    """The kind of separator that follows the word."""
+
+
+_SEPARATOR_CHARS = f"{MAQAF.char}{PASEQ.char}{SOF_PASSUK.char}"
+# A word followed by all the whitespace and punctuation up to the next word.
+_TOKEN = re.compile(rf"([^\s{_SEPARATOR_CHARS}]+)([\s{_SEPARATOR_CHARS}]*)")
+
+
+@lru_cache(maxsize=1024)
+def _separator_kind(separator: str) -> SeparatorKind:
+    """
+    Returns the kind of the separator between two words. When a separator has more than one of them, a sof passuk
+    takes precedence over a paseq, which takes precedence over a maqaf.
+
+    Only a handful of distinct separators (" ", "־", " ׀ ", "׃ " and so on) appear in real texts, so they are cached.
+    """
+    if SOF_PASSUK.char in separator:
+        return SeparatorKind.SOF_PASSUK
+    if PASEQ.char in separator:
+        return SeparatorKind.PASEQ
+    if MAQAF.char in separator:
+        return SeparatorKind.MAQAF
+    return SeparatorKind.SPACE
+
+
+def tokenize(string: str) -> Iterator[Token]:
+    """
+    Yields the words of a string with their offsets and the kind of separator that follows them, in one pass.
+
+    Words are split on whitespace and on maqafs, and the paseq and sof passuk characters are never part of a word.
+    A word followed by a sof passuk, paseq or maqaf has that separator kind, even when it is also followed by spaces.
+    Otherwise, it is `SeparatorKind.SPACE`, or `SeparatorKind.END` for the last word of the string.
+
+    ``` python
+    >>> for token in tokenize("וַיְהִי־עֶרֶב ׀ וַיְהִי־בֹקֶר יוֹם אֶחָד׃"):
+    ...     print(token.start, token.end, token.word, token.separator.name)
+    0 7 וַיְהִי MAQAF
+    8 13 עֶרֶב PASEQ
+    16 23 וַיְהִי MAQAF
+    24 29 בֹקֶר SPACE
+    30 34 יוֹם SPACE
+    35 40 אֶחָד SOF_PASSUK
+    ```
+
+    :param string: The string to tokenize.
+    :return: An iterator of the tokens in the string.
+    """
+    length = len(string)
+    # Creating the tuple directly skips the slower `Token.__new__`, which only forwards its arguments.
+    new_token = tuple.__new__
+    for match in _TOKEN.finditer(string):
+        word, separator = match.groups()
+        kind = _separator_kind(separator)
+        if kind is SeparatorKind.SPACE and match.end() == length:
+            kind = SeparatorKind.END
+        start = match.start()
+        yield new_token(Token, (start, start + len(word), word, kind))
@@ -0,0 +1,58 @@
+import pytest
+
+from hebrew import Hebrew
+from hebrew.cleaner import Cleaner
+from hebrew.chars import MAQAF, PASEQ, SOF_PASSUK
+from tests.test_hebrew import taamei_hamikra
+
+
+@pytest.mark.parametrize("text", taamei_hamikra)
+def test_cleaner_matches_chained_methods(text):
+    hs = Hebrew(text)
+    assert Cleaner(no_taamim=True)(text) == hs.no_taamim().string
+    assert Cleaner(no_niqqud=True)(text) == hs.no_niqqud().string
+    assert Cleaner(text_only=True)(text) == hs.text_only().string
+    assert Cleaner(no_maqaf=True)(text) == hs.no_maqaf().string
+    assert Cleaner(no_sof_passuk=True)(text) == hs.no_sof_passuk().string
+    assert Cleaner(normalize=True)(text) == Hebrew(text).normalize().string
+    assert (
+        Cleaner(no_maqaf=True, no_sof_passuk=True, no_taamim=True, no_niqqud=True)(text)
+        == hs.no_taamim(remove_maqaf=True, remove_sof_passuk=True).no_niqqud().string
+    )
+    assert (
+        Cleaner(no_maqaf=True, text_only=True)(hs)
+        == hs.text_only(remove_maqaf=True).string
+    )
+
+
+def test_cleaner_no_options():
+    assert Cleaner()(taamei_hamikra[0]) == taamei_hamikra[0]
+
+
+def test_cleaner_normalizes_first():
+    # 'שּׁ' is normalized to a shin followed by a dagesh and shin dot, which are then removed as niqqud.
+    assert Cleaner(normalize=True, no_niqqud=True)("שּׁ") == "ש"
+
+
+def test_cleaner_removes_paseq():
+    text = taamei_hamikra[4]
+    cleaned = Cleaner(no_taamim=True, no_niqqud=True, no_maqaf=True)(text)
+    assert PASEQ.char not in cleaned
+    assert MAQAF.char not in cleaned
+    assert SOF_PASSUK.char in cleaned
+    assert "  " not in cleaned
+
+
+def test_cleaner_repr():
+    assert repr(Cleaner()) == "Cleaner()"
+    assert repr(Cleaner(no_niqqud=True, text_only=True)) == (
+        "Cleaner(no_niqqud=True, text_only=True)"
+    )
+
+
+def test_hebrew_clean():
+    hs = Hebrew("וַֽיְהִי־עֶ֥רֶב")
+    cleaned = hs.clean(no_maqaf=True, no_taamim=True, no_niqqud=True)
+    assert isinstance(cleaned, Hebrew)
+    assert cleaned.string == "ויהי ערב"
+    assert hs.clean().string == hs.string
@@ -0,0 +1,91 @@
+import pytest
+
+from hebrew.els import ELSMatch, ELSText
+from tests.test_hebrew import taamei_hamikra
+
+TEXT = ELSText(" ".join(taamei_hamikra))
+
+
+def brute_force(letters, term, min_skip, max_skip, backwards=True):
+    matches = []
+    for skip in range(min_skip, max_skip + 1):
+        for signed in (skip, -skip) if backwards else (skip,):
+            for start in range(len(letters)):
+                positions = range(start, start + len(term) * signed, signed)
+                if positions[-1] < 0 or positions[-1] >= len(letters):
+                    continue
+                if all(letters[p] == t for p, t in zip(positions, term)):
+                    matches.append(ELSMatch(start, signed, len(term)))
+    return matches
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize("term", ["תורה", "אלהים", "משה", "יה"])
+def test_matches_brute_force(term, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    expected = brute_force(TEXT.letters, term.replace("ם", "מ"), 1, 40)
+    assert expected
+    assert TEXT.search(term, 1, 40, use_numpy=use_numpy) == expected
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_forwards_only(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    expected = brute_force(TEXT.letters, "תורה", 5, 60, backwards=False)
+    assert TEXT.search("תורה", 5, 60, backwards=False, use_numpy=use_numpy) == expected
+
+
+def test_match_positions():
+    for match in TEXT.search("תורה", 1, 100):
+        letters = "".join(TEXT.letters[p] for p in match.positions)
+        assert letters == "תורה"
+
+
+def test_letters():
+    els = ELSText("בְּרֵאשִׁית בָּרָא אֱלֹהִים, Genesis 1:1 ׃")
+    assert els.letters == "בראשיתבראאלהימ"
+    assert len(els) == 14
+    els = ELSText("בְּרֵאשִׁית בָּרָא אֱלֹהִים", normalize_finals=False)
+    assert els.letters == "בראשיתבראאלהים"
+    assert els.search("ים", max_skip=1) == [ELSMatch(12, 1, 2)]
+    assert els.search("ימ", max_skip=1) == []
+
+
+def test_positions():
+    els = ELSText("בְּרֵאשִׁית בָּרָא אֱלֹהִים")
+    assert els.positions("ר") == [1, 7]
+    assert els.positions("ם") == els.positions("מ") == [13]
+    assert els.positions("ק") == []
+    assert TEXT.positions("ת") == [i for i, c in enumerate(TEXT.letters) if c == "ת"]
+    # Anything other than a single hebrew letter is never found.
+    for letter in ("€", "a", "\x01", "", "רא", "ְ"):
+        assert els.positions(letter) == []
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_term_with_other_characters(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    expected = TEXT.search("תורה", max_skip=50, use_numpy=use_numpy)
+    assert TEXT.search("€ת☃ורה!", max_skip=50, use_numpy=use_numpy) == expected
+
+
+def test_term_is_cleaned():
+    assert TEXT.search("תּוֹרָה", max_skip=50) == TEXT.search("תורה", max_skip=50)
+
+
+def test_skip_larger_than_text():
+    els = ELSText("אבג")
+    assert els.search("אג", max_skip=100) == [ELSMatch(0, 2, 2)]
+    assert els.search("גבא", max_skip=100) == [ELSMatch(2, -1, 3)]
+
+
+@pytest.mark.parametrize(
+    "term,min_skip,max_skip",
+    [("א", 1, 10), ("", 1, 10), ("abc", 1, 10), ("אב", 0, 10), ("אב", 5, 4)],
+)
+def test_invalid_arguments(term, min_skip, max_skip):
+    with pytest.raises(ValueError):
+        TEXT.search(term, min_skip, max_skip)
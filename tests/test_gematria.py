@@ -1,7 +1,16 @@
+import sys
+
 import pytest
 
 from hebrew import Hebrew
-from hebrew.gematria import GematriaTypes
+from hebrew.gematria import (
+    GematriaTypes,
+    calculate_gematria,
+    gematria_by_line,
+    gematria_by_word,
+    gematria_many,
+    _import_numpy,
+)
 
 # Test inputs and their expected values for each method type.
 # Add new test cases here!
@@ -77,6 +86,42 @@ def test_gematria_values(
         Hebrew(hebrew_text + " Add english letters").gematria(gematria_method)
         == expected_val
     )
+    assert calculate_gematria(hebrew_text, gematria_method) == expected_val
+
+
+def test_gematria_all():
+    for text, expected in test_values.items():
+        assert Hebrew(text).gematria_all() == {m: expected[m] for m in GematriaTypes}
+        assert len(Hebrew(text).gematria_all()) == 23
+        methods = [GematriaTypes.MISPAR_GADOL, GematriaTypes.MISPAR_NEELAM]
+        assert Hebrew(text).gematria_all(methods) == {m: expected[m] for m in methods}
+    assert Hebrew("").gematria_all([]) == {}
+    assert set(Hebrew("Hello").gematria_all().values()) == {0}
+
+
+def test_gematria_all_alt_spelling():
+    hebrew_text = "אבגדהוזחטיכךלמםנןסעפףצץקרשת"
+    spellings = {"ה": "הה", "ו": "ואו", "פ": "פה", "ת": "תאו"}
+    assert Hebrew(hebrew_text).gematria_all(
+        [GematriaTypes.MISPAR_NEELAM, GematriaTypes.MISPAR_SHEMI_MILUI], spellings
+    ) == {GematriaTypes.MISPAR_NEELAM: 2939, GematriaTypes.MISPAR_SHEMI_MILUI: 4714}
+
+
+def test_gematria_many():
+    texts = list(test_values.keys())
+    for method in GematriaTypes:
+        expected = [test_values[t][method] for t in texts]
+        assert gematria_many(texts, method) == expected
+        assert gematria_many((Hebrew(t) for t in texts), method) == expected
+    assert gematria_many([]) == []
+
+
+def test_gematria_many_alt_spelling():
+    hebrew_text = "אבגדהוזחטיכךלמםנןסעפףצץקרשת"
+    spellings = {"ה": "הה", "ו": "ואו", "פ": "פה", "ת": "תאו"}
+    assert gematria_many(
+        [hebrew_text, "English"], GematriaTypes.MISPAR_NEELAM, spellings
+    ) == [2939, 0]
 
 
 def test_mispar_shemi_milui_change_spelling():
@@ -224,3 +269,80 @@ def test_mixed_input():
         assert (
             Hebrew("Both hebrew: 'שָׁלוֹם' and English: 'Hello dev!'").gematria(t) > 0
         ), "gematria should always have a value > 0 when there is any hebrew text in a string"
+
+
+def test_simple_gematria_values_match_chars():
+    from hebrew.chars import HEBREW_CHARS
+    from hebrew.gematria import _SIMPLE_GEMATRIA_VALUES
+
+    for method, values in _SIMPLE_GEMATRIA_VALUES.items():
+        for letter in HEBREW_CHARS:
+            assert values[letter.char] == getattr(letter, method.value)
+
+
+def test_letters_without_value():
+    # Special characters such as 'ℵ' are HebrewChars, but are not assigned a value in any gematria method.
+    for t in GematriaTypes:
+        assert Hebrew("ℵ").gematria(t) == 0
+    assert Hebrew("ℵא").gematria() == 1
+
+
+def test_gematria_chars_match_hebrew_chars():
+    from hebrew.chars import HEBREW_CHARS
+    from hebrew.gematria import _GEMATRIA_CHARS
+
+    assert _GEMATRIA_CHARS == {c.char for c in HEBREW_CHARS} | {" "}
+
+
+def test_positional_methods_long_input():
+    letter_count = 100_000
+    expected = letter_count * (letter_count + 1) // 2
+    text = Hebrew("א" * letter_count)
+    assert text.gematria(GematriaTypes.MISPAR_BONEEH) == expected
+    assert text.gematria(GematriaTypes.MISPAR_HAACHOR) == expected
+
+
+@pytest.mark.parametrize("use_numpy", [False, None])
+def test_gematria_by_word(use_numpy):
+    if use_numpy is None:
+        pytest.importorskip("numpy")
+    text = "בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים\nאֵ֥ת הַשָּׁמַ֖יִם  English\tוְאֵ֥ת הָאָֽרֶץ׃"
+    for method in [GematriaTypes.MISPAR_HECHRACHI, GematriaTypes.MISPAR_GADOL]:
+        expected = [Hebrew(w).gematria(method) for w in text.split()]
+        assert list(gematria_by_word(text, method, use_numpy)) == expected
+    assert list(gematria_by_word("", use_numpy=use_numpy)) == []
+
+
+@pytest.mark.parametrize("use_numpy", [False, None])
+def test_gematria_by_line(use_numpy):
+    if use_numpy is None:
+        pytest.importorskip("numpy")
+    for text in ["אב\nגד\r\nה\n", "\n\nאב", "א\r\rב\u2028ג", "", "\n"]:
+        expected = [Hebrew(w).gematria() for w in text.splitlines()]
+        assert list(gematria_by_line(text, use_numpy=use_numpy)) == expected
+
+
+@pytest.mark.parametrize("use_numpy", [False, None])
+def test_gematria_by_segment_lone_surrogates(use_numpy):
+    if use_numpy is None:
+        pytest.importorskip("numpy")
+    text = b"\xd7\x90\xd7\x91 \x80\xd7\x92\xd7\x93\n\xff".decode(
+        "utf-8", "surrogateescape"
+    )
+    assert list(gematria_by_word(text, use_numpy=use_numpy)) == [3, 7, 0]
+    assert list(gematria_by_line(text, use_numpy=use_numpy)) == [10, 0]
+
+
+def test_gematria_by_word_complex_method():
+    with pytest.raises(ValueError):
+        gematria_by_word("אב", GematriaTypes.MISPAR_KOLEL)
+
+
+def test_import_numpy_without_numpy(monkeypatch):
+    # A None entry in sys.modules makes the import fail as if NumPy wasn't installed.
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    assert _import_numpy(None) is None
+    assert _import_numpy(False) is None
+    with pytest.raises(ImportError):
+        _import_numpy(True)
+    assert gematria_by_word("אב גד") == [3, 7]
@@ -0,0 +1,123 @@
+import pytest
+
+from hebrew import Hebrew
+from hebrew.gematria import GematriaTypes, calculate_gematria
+from hebrew.gematria_index import GematriaIndex, MappedGematriaIndex, Posting
+from tests.test_hebrew import taamei_hamikra
+
+WORDS = [w for p in taamei_hamikra for w in Hebrew(p).iter_words(as_str=True)]
+METHODS = (GematriaTypes.MISPAR_HECHRACHI, GematriaTypes.MISPAR_GADOL)
+
+
+@pytest.fixture
+def index():
+    index = GematriaIndex(METHODS)
+    index.add_words(WORDS)
+    return index
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_find_matches_brute_force(index, method):
+    for value in {calculate_gematria(w, method) for w in WORDS}:
+        expected = [
+            i for i, w in enumerate(WORDS) if calculate_gematria(w, method) == value
+        ]
+        postings = index.find(value, method)
+        assert [p.location for p in postings] == expected
+        assert all(index.text(p.word_id) == WORDS[p.location] for p in postings)
+        assert index.find_texts(value, method) == list(
+            dict.fromkeys(WORDS[i] for i in expected)
+        )
+
+
+def test_find_range(index):
+    low, high = 50, 400
+    postings = index.find_range(low, high)
+    expected = sorted(
+        (calculate_gematria(w), i)
+        for i, w in enumerate(WORDS)
+        if low <= calculate_gematria(w) <= high
+    )
+    assert [(index.value(p.word_id), p.location) for p in postings] == expected
+    assert index.find_range(high, low) == []
+
+
+def test_values_update_after_add(index):
+    values = index.values()
+    assert values == sorted({calculate_gematria(w) for w in WORDS})
+    word_id = index.add("ת" * 100, location=1000)
+    assert index.values()[-1] == 40000
+    assert index.find_range(40000, 40000) == [Posting(word_id, 1000)]
+    assert index.add("ת" * 100) == word_id
+    assert index.find(40000) == [Posting(word_id, 1000), Posting(word_id, 1001)]
+    assert index.find_texts(40000) == ["ת" * 100]
+
+
+def test_queries_for_missing_values(index):
+    assert index.find(-1) == []
+    assert index.find_texts(-1) == []
+
+
+def test_unindexed_method(index):
+    with pytest.raises(ValueError):
+        index.find(26, GematriaTypes.ATBASH)
+    with pytest.raises(ValueError):
+        GematriaIndex(())
+
+
+def test_len(index):
+    assert len(index) == len(set(WORDS))
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_mapped_index_matches_index(index, tmp_path, method):
+    path = tmp_path / "index.idx"
+    index.save(path, method)
+    with MappedGematriaIndex(path) as mapped:
+        assert mapped.method == method
+        assert len(mapped) == len(index)
+        assert mapped.values() == index.values(method)
+        for value in index.values(method):
+            assert mapped.find(value) == index.find(value, method)
+            assert mapped.find_texts(value) == index.find_texts(value, method)
+        assert mapped.find(-1) == []
+        assert mapped.find_range(50, 400) == index.find_range(50, 400, method)
+        assert mapped.find_range(400, 50) == []
+        assert [mapped.text(i) for i in range(len(index))] == [
+            index.text(i) for i in range(len(index))
+        ]
+
+
+def test_mapped_empty_index(tmp_path):
+    path = tmp_path / "index.idx"
+    GematriaIndex().save(path)
+    with MappedGematriaIndex(path) as mapped:
+        assert mapped.values() == []
+        assert mapped.find(1) == []
+        assert len(mapped) == 0
+
+
+def test_mapped_index_invalid_files(index, tmp_path):
+    path = tmp_path / "index.idx"
+    path.write_bytes(b"not an index" * 10)
+    with pytest.raises(ValueError):
+        MappedGematriaIndex(path)
+    index.save(path)
+    path.write_bytes(path.read_bytes()[:-100])
+    with pytest.raises(ValueError):
+        MappedGematriaIndex(path)
+
+
+@pytest.mark.parametrize("location", [2**63, -(2**63) - 1])
+def test_save_rejects_values_larger_than_int64(tmp_path, location):
+    index = GematriaIndex()
+    index.add("אב", location=location)
+    path = tmp_path / "index.idx"
+    with pytest.raises(ValueError):
+        index.save(path)
+    assert not path.exists()
+    index = GematriaIndex()
+    index.add("אב", location=2**63 - 1)
+    index.save(path)
+    with MappedGematriaIndex(path) as mapped:
+        assert mapped.find(3)[0].location == 2**63 - 1
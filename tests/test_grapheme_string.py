@@ -1,8 +1,11 @@
 from collections.abc import Hashable
 
+import grapheme
 import pytest
 
-from hebrew import GraphemeString
+from hebrew import GraphemeString, Hebrew
+from hebrew.chars import ALL_CHARS
+from hebrew.grapheme_string import _grapheme_lengths
 
 
 @pytest.fixture
@@ -248,3 +251,118 @@ def test_hashable():
     )
     assert isinstance(one, Hashable)
     assert one.__hash__() == two.__hash__()
+
+
+def test_boundaries_are_cached(hebrew_grapheme_string):
+    assert hebrew_grapheme_string._cached_boundaries() is None
+    length = hebrew_grapheme_string.length
+    boundaries = hebrew_grapheme_string._cached_boundaries()
+    assert len(boundaries) == length + 1
+    assert boundaries[0] == 0
+    assert boundaries[-1] == len(hebrew_grapheme_string.string)
+    assert hebrew_grapheme_string.slice(2, 5) == "אָ֗רֶץ"
+    assert hebrew_grapheme_string._cached_boundaries() is boundaries
+
+
+def test_boundaries_follow_string_changes(hebrew_grapheme_string, hebrew_no_nikkud):
+    assert hebrew_grapheme_string.length == 65
+    hebrew_grapheme_string.string = hebrew_no_nikkud
+    assert hebrew_grapheme_string._cached_boundaries() is None
+    assert hebrew_grapheme_string.length == len(hebrew_no_nikkud)
+    assert hebrew_grapheme_string.slice(end=5) == "והארץ"
+
+
+def test_cached_safe_split_index():
+    string = "tamil நி (ni)"
+    g = GraphemeString(string)
+    expected = [g.safe_split_index(i) for i in range(len(string) + 1)]
+    g.length
+    assert [g.safe_split_index(i) for i in range(len(string) + 1)] == expected
+    assert g.safe_split_index(-1) == 0
+    assert g.safe_split_index(100) == len(string)
+
+
+def test_cached_get_length():
+    g = GraphemeString("".join(str(i) for i in range(100)))
+    assert g.get_length(30) == 30
+    g.length
+    assert g.get_length(30) == 30
+    assert g.get_length(1000) == g.length
+
+
+def test_contains_with_cached_boundaries():
+    g = GraphemeString("🇪🇸🇪🇪")
+    assert not g.contains("🇸🇪")
+    assert g.contains("🇪🇪")
+    assert g.contains("🇪🇸🇪🇪")
+    assert g.contains("")
+    assert not GraphemeString("✊🏾").contains("✊")
+
+
+def test_len_and_iter(hebrew_grapheme_string):
+    assert len(hebrew_grapheme_string) == hebrew_grapheme_string.length
+    assert list(hebrew_grapheme_string) == list(hebrew_grapheme_string.graphemes)
+    assert len(GraphemeString("")) == 0
+
+
+def test_empty_string_is_truthy():
+    assert GraphemeString("")
+    assert Hebrew("")
+    assert (Hebrew("") or None) is not None
+
+
+def test_getitem_int(hebrew_grapheme_string):
+    graphemes = list(hebrew_grapheme_string.graphemes)
+    for i in range(-len(graphemes), len(graphemes)):
+        assert hebrew_grapheme_string[i] == graphemes[i]
+    assert hebrew_grapheme_string[0] == "וְ"
+    assert hebrew_grapheme_string[-1] == "ם"
+    with pytest.raises(IndexError):
+        hebrew_grapheme_string[len(graphemes)]
+    with pytest.raises(IndexError):
+        hebrew_grapheme_string[-len(graphemes) - 1]
+    with pytest.raises(TypeError):
+        hebrew_grapheme_string["1"]
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        slice(None),
+        slice(2, 5),
+        slice(-5, None),
+        slice(None, -3),
+        slice(-8, -2),
+        slice(5, 2),
+        slice(100, None),
+        slice(None, None, 2),
+        slice(None, None, -1),
+        slice(-2, 3, -3),
+    ],
+)
+def test_getitem_slice(hebrew_grapheme_string, index):
+    graphemes = list(hebrew_grapheme_string.graphemes)
+    sliced = hebrew_grapheme_string[index]
+    assert isinstance(sliced, GraphemeString)
+    assert sliced.string == "".join(graphemes[index])
+
+
+HEBREW_AND_ASCII = sorted(
+    {c.char for c in ALL_CHARS if len(c.char) == 1} | {chr(i) for i in range(128)}
+)
+
+
+@pytest.mark.parametrize("first", HEBREW_AND_ASCII)
+def test_hebrew_segmenter_matches_grapheme(first):
+    for second in HEBREW_AND_ASCII:
+        string = first + second + "ָ"
+        assert list(_grapheme_lengths(string)) == list(
+            grapheme.grapheme_lengths(string)
+        )
+
+
+def test_hebrew_segmenter_fallback():
+    # Strings with other characters are segmented by the grapheme library.
+    string = "שָׁלוֹם 🏳️‍🌈"
+    assert list(_grapheme_lengths(string)) == list(grapheme.grapheme_lengths(string))
+    assert GraphemeString(string)[-1] == "🏳️‍🌈"
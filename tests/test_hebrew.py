@@ -1,6 +1,7 @@
 import pytest
 
-from hebrew import Hebrew
+from hebrew import FrozenHebrew, Hebrew
+from hebrew.gematria import GematriaTypes
 from hebrew.chars import *
 
 taamei_hamikra = [
@@ -164,6 +165,20 @@ def test_no_niqqud():
     assert hs.no_niqqud().string == "וֽיהי־ע֥רב וֽיהי־ב֖קר י֥ום רביעֽי׃"
 
 
+def test_no_niqqud_shuruk():
+    # The vav of a shuruk is a letter and must not be removed along with the dagesh.
+    assert Hebrew("תֹ֙הוּ֙").no_niqqud().string == "ת֙הו֙"
+    assert Hebrew("תֹ֙הוּ֙").text_only().string == "תהו"
+
+
+def test_paseq():
+    hs = Hebrew(taamei_hamikra[4])
+    assert PASEQ.char in hs.string
+    assert PASEQ.char not in hs.no_taamim().string
+    assert PASEQ.char not in hs.text_only().string
+    assert "  " not in hs.text_only().string
+
+
 def test_no_taamim():
     hs = Hebrew(taamei_hamikra[1])
     assert hs.no_taamim(remove_maqaf=False, remove_sof_passuk=False).string == nikkud[1]
@@ -241,3 +256,89 @@ def test_normalize_multiple_abnormal_chars():
 
 def test_normalize_mixed_chars():
     assert Hebrew("אזּטּ").normalize().string == "אזּטּ"
+
+
+def test_is_normalized():
+    assert Hebrew("שלום עולם").is_normalized()
+    assert Hebrew("Hello").is_normalized()
+    assert not Hebrew("ﭏ").is_normalized()
+    # A sin dot followed by a qamats is not in canonical order.
+    assert not Hebrew("ש\u05c2\u05b8").is_normalized()
+    assert Hebrew("ש\u05c2\u05b8").normalize().is_normalized()
+    assert Hebrew("ײ").is_normalized()
+    assert not Hebrew("ײ").is_normalized(normalize_yiddish=True)
+
+
+def test_getitem():
+    hs = Hebrew("בְּרֵאשִׁ֖ית בָּרָ֣א")
+    assert hs[0] == "בְּ"
+    assert hs[-1] == "א"
+    assert isinstance(hs[-3:], Hebrew)
+    assert hs[-3:] == Hebrew("בָּרָ֣א")
+    assert len(hs) == 10
+
+
+@pytest.mark.parametrize("pasuk", [(p) for p in taamei_hamikra])
+def test_frozen_hebrew_caches_results(pasuk):
+    hs = FrozenHebrew(pasuk)
+    assert hs.text_only() is hs.text_only()
+    assert hs.no_taamim().no_niqqud() is hs.no_taamim().no_niqqud()
+    assert isinstance(hs.no_niqqud(), FrozenHebrew)
+    assert hs.no_niqqud() == Hebrew(pasuk).no_niqqud()
+    assert hs.text_only(remove_maqaf=True) == Hebrew(pasuk).text_only(True)
+    assert hs.gematria(GematriaTypes.MISPAR_GADOL) == Hebrew(pasuk).gematria(
+        GematriaTypes.MISPAR_GADOL
+    )
+    assert hs.gematria_all() == Hebrew(pasuk).gematria_all()
+    assert hs.length == Hebrew(pasuk).length
+
+
+@pytest.mark.parametrize("pasuk", [(p) for p in taamei_hamikra])
+def test_frozen_hebrew_cache_is_not_shared_with_caller(pasuk):
+    hs = FrozenHebrew(pasuk)
+    words = hs.words()
+    assert all(isinstance(w, FrozenHebrew) for w in words)
+    words.clear()
+    assert hs.words() == Hebrew(pasuk).words()
+    hs.gematria_all().clear()
+    assert hs.gematria_all() == Hebrew(pasuk).gematria_all()
+
+
+def test_frozen_hebrew_unhashable_arguments():
+    hs = FrozenHebrew("ו")
+    alt = {"ו": "ואו"}
+    assert hs.gematria(GematriaTypes.MISPAR_SHEMI_MILUI, alt) == Hebrew("ו").gematria(
+        GematriaTypes.MISPAR_SHEMI_MILUI, alt
+    )
+
+
+def test_frozen_hebrew_is_immutable():
+    hs = FrozenHebrew("שָׂחַקְתִּי כְּמוֹ")
+    with pytest.raises(AttributeError):
+        hs.string = "שלום"
+    normalized = hs.normalize()
+    assert hs.string == "שָׂחַקְתִּי כְּמוֹ"
+    assert isinstance(normalized, FrozenHebrew)
+    assert normalized == Hebrew("שָׂחַקְתִּי כְּמוֹ").normalize()
+    assert hs.normalize() is normalized
+
+
+@pytest.mark.parametrize("pasuk", [(p) for p in taamei_hamikra])
+@pytest.mark.parametrize("split_maqaf", [False, True])
+def test_iter_words(pasuk, split_maqaf):
+    hs = Hebrew(pasuk)
+    words = hs.words(split_maqaf=split_maqaf)
+    assert list(hs.iter_words(split_maqaf=split_maqaf)) == words
+    assert list(hs.iter_words(split_maqaf=split_maqaf, as_str=True)) == [
+        w.string for w in words
+    ]
+    for start, end, word in hs.iter_words(split_maqaf=split_maqaf, with_offsets=True):
+        assert isinstance(word, Hebrew)
+        assert pasuk[start:end] == word.string
+
+
+def test_iter_words_is_lazy():
+    words = Hebrew("א\tב\nג  ד").iter_words(as_str=True)
+    assert next(words) == "א"
+    assert list(words) == ["ב", "ג", "ד"]
+    assert list(Hebrew("").iter_words()) == []
@@ -1,8 +1,17 @@
 import pytest
 
-from hebrew.numerical_conversion.convert import number_to_hebrew_string
+from hebrew.numerical_conversion import convert
+from hebrew.numerical_conversion.convert import (
+    hebrew_string_to_number,
+    number_to_hebrew_string,
+    set_number_cache_limit,
+)
 from hebrew.hebrew_obj import Hebrew
-from hebrew.numerical_conversion.substitute import Substitutions
+from hebrew.numerical_conversion.substitute import (
+    CompiledSubstitutions,
+    Substitutions,
+    _get_word_substitution_func,
+)
 
 
 WITH_GERESH = {
@@ -2507,3 +2516,153 @@ def test_with_english_quote(number, expected_output):
 def test_with_no_punctuation(number, expected_output):
     assert Hebrew.from_number(number, False) == Hebrew(expected_output)
     assert number_to_hebrew_string(number, False) == expected_output
+
+
+@pytest.mark.parametrize(
+    "table", [WITH_GERESH, NO_PUNCTUATION, NO_SUBSTITUTION, POLITE_SUBSTITUTION]
+)
+def test_hebrew_string_to_number(table):
+    for number, string in table.items():
+        assert hebrew_string_to_number(string) == number
+        assert (
+            hebrew_string_to_number(string.replace("׳", "'").replace("״", '"'))
+            == number
+        )
+
+
+@pytest.mark.parametrize("substitution_functions", [None, Substitutions.ALL])
+def test_hebrew_string_to_number_round_trip(substitution_functions):
+    for number in range(1, 2000):
+        string = number_to_hebrew_string(
+            number, substitution_functions=substitution_functions
+        )
+        assert hebrew_string_to_number(string) == number
+
+
+@pytest.mark.parametrize(
+    "string, expected_output",
+    [
+        ("ה׳תשפ״ד", 5784),
+        ("ה'תשפ\"ד", 5784),
+        ("ה׳ תשפ״ד", 5784),
+        ("  ה׳תשפ״ד\n", 5784),
+        ("ה׳תשפד", 5784),
+        ("ה׳תש״ם", 5740),
+        ("א׳ב׳ג׳", 1002003),
+        ("תשפ''ד", 784),
+        ("ה׳", 5),
+        ("ך", 20),
+    ],
+)
+def test_hebrew_string_to_number_thousands(string, expected_output):
+    assert hebrew_string_to_number(string) == expected_output
+
+
+@pytest.mark.parametrize(
+    "string", ["", " ", "׳", "״", "abc", "תש פד", "5784", "ה׳׳׳ ב"]
+)
+def test_hebrew_string_to_number_invalid(string):
+    with pytest.raises(ValueError):
+        hebrew_string_to_number(string)
+
+
+@pytest.fixture
+def number_cache_limit():
+    yield set_number_cache_limit
+    set_number_cache_limit()
+
+
+@pytest.mark.parametrize("punctuate", [True, False])
+@pytest.mark.parametrize("geresh", [True, False])
+@pytest.mark.parametrize(
+    "substitution_functions", [None, Substitutions.DEFAULT, Substitutions.ALL]
+)
+def test_memoized_matches_algorithm(punctuate, geresh, substitution_functions):
+    for number in range(1, 1100):
+        expected = convert._number_to_hebrew_string(
+            number, punctuate, geresh, substitution_functions
+        )
+        for _ in range(2):
+            assert (
+                number_to_hebrew_string(
+                    number, punctuate, geresh, substitution_functions
+                )
+                == expected
+            )
+
+
+def test_memoization_limit(number_cache_limit):
+    number_cache_limit(20)
+    assert number_to_hebrew_string(15) == "ט״ו"
+    assert number_to_hebrew_string(21) == "כ״א"
+    assert convert._cache[(True, True, Substitutions.DEFAULT)][15] == "ט״ו"
+    assert len(convert._cache[(True, True, Substitutions.DEFAULT)]) == 21
+
+    number_cache_limit(10)
+    assert convert._cache == {}
+    assert number_to_hebrew_string(15) == "ט״ו"
+    assert convert._cache == {}
+
+    number_cache_limit(0)
+    assert number_to_hebrew_string(1) == "א׳"
+    assert convert._cache == {}
+
+    with pytest.raises(ValueError):
+        number_cache_limit(-1)
+
+
+def test_unhashable_substitution_functions():
+    functions = list(Substitutions.ALL)
+    assert number_to_hebrew_string(270, False, substitution_functions=functions) == (
+        "ער"
+    )
+    assert number_to_hebrew_string(15, substitution_functions=[]) == "י״ה"
+
+
+def test_memoized_input_validation():
+    for number in (0, -1):
+        with pytest.raises(ValueError):
+            number_to_hebrew_string(number)
+    assert number_to_hebrew_string(True) == "א׳"
+    assert number_to_hebrew_string(5.0) == number_to_hebrew_string(5)
+
+
+def _chain(functions, value):
+    for func in functions:
+        value = func(value)
+    return value
+
+
+@pytest.mark.parametrize(
+    "functions",
+    [Substitutions.DEFAULT, Substitutions.ALL, Substitutions.ALL[::-1], ()],
+)
+def test_compiled_substitutions(functions):
+    compiled = CompiledSubstitutions(functions)
+    assert len(compiled._steps) <= 1
+    for number in range(1, 6000):
+        value = number_to_hebrew_string(number, False, substitution_functions=None)
+        assert compiled(value) == _chain(functions, value)
+    for value in ("רעה", "ארעה", "שד", "אשד", "תשמד", "רעב", "תתרצח", ""):
+        assert compiled(value) == _chain(functions, value)
+        # `$` in the original patterns also matches just before a trailing newline.
+        for ending in ("\n", "\n\n", "\r\n", " "):
+            assert compiled(value + ending) == _chain(functions, value + ending)
+
+
+def test_compiled_substitutions_fall_back_to_chaining():
+    # The second rule matches the result of the first, so they can't be merged into a single lookup.
+    overlapping = (
+        _get_word_substitution_func("ב$", "א"),
+        _get_word_substitution_func("גא$", "ד"),
+    )
+    assert CompiledSubstitutions(overlapping)("גב") == "ד"
+    # Patterns that aren't anchored to the end of the value, and other callables, are called in order.
+    functions = (
+        _get_word_substitution_func("א", "ב"),
+        str.upper,
+    ) + Substitutions.DEFAULT
+    compiled = CompiledSubstitutions(functions)
+    assert len(compiled._steps) == 3
+    for value in ("איה", "יו", "abc"):
+        assert compiled(value) == _chain(functions, value)
@@ -0,0 +1,88 @@
+import pytest
+
+from hebrew import Hebrew
+from hebrew.gematria import GematriaTypes, calculate_gematria
+from hebrew.phrase_search import (
+    PhraseMatch,
+    _ADDITIVE_METHODS,
+    find_phrases_with_gematria,
+    iter_phrases_with_gematria,
+)
+from tests.test_hebrew import taamei_hamikra
+
+WORDS = [w for p in taamei_hamikra[:3] for w in Hebrew(p).iter_words(as_str=True)]
+
+
+def brute_force(words, value, method, max_words):
+    return [
+        PhraseMatch(start, end, " ".join(words[start:end]))
+        for end in range(1, len(words) + 1)
+        for start in range(max(0, end - max_words), end)
+        if calculate_gematria(" ".join(words[start:end]), method) == value
+    ]
+
+
+@pytest.mark.parametrize("method", sorted(_ADDITIVE_METHODS, key=lambda m: m.value))
+def test_matches_brute_force(method):
+    max_words = 4
+    values = {
+        calculate_gematria(" ".join(WORDS[i : i + n]), method)
+        for i in range(0, len(WORDS), 5)
+        for n in (1, 2, 3)
+    }
+    for value in values:
+        expected = brute_force(WORDS, value, method, max_words)
+        assert expected
+        assert find_phrases_with_gematria(WORDS, value, method, max_words) == expected
+
+
+def test_words_without_value():
+    words = ["א", "׀", "ב", "-", "-", "א"]
+    assert find_phrases_with_gematria(words, 0) == brute_force(
+        words, 0, GematriaTypes.MISPAR_HECHRACHI, 10
+    )
+    assert find_phrases_with_gematria(words, 2, max_words=3) == [
+        PhraseMatch(1, 3, "׀ ב"),
+        PhraseMatch(2, 3, "ב"),
+        PhraseMatch(1, 4, "׀ ב -"),
+        PhraseMatch(2, 4, "ב -"),
+        PhraseMatch(2, 5, "ב - -"),
+    ]
+
+
+def test_max_words():
+    words = ["א"] * 10
+    matches = find_phrases_with_gematria(words, 5, max_words=5)
+    assert [(m.start, m.end) for m in matches] == [(i, i + 5) for i in range(6)]
+    assert find_phrases_with_gematria(words, 6, max_words=5) == []
+
+
+def test_accepts_hebrew_words():
+    words = Hebrew("בְּרֵאשִׁית בָּרָא אֱלֹהִים").words()
+    assert list(iter_phrases_with_gematria(words, 289)) == [
+        PhraseMatch(1, 3, "בָּרָא אֱלֹהִים")
+    ]
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        GematriaTypes.MISPAR_BONEEH,
+        GematriaTypes.MISPAR_HAACHOR,
+        GematriaTypes.MISPAR_HAMERUBAH_HAKLALI,
+        GematriaTypes.MISPAR_KATAN_MISPARI,
+    ],
+)
+def test_non_additive_methods(method):
+    with pytest.raises(ValueError):
+        find_phrases_with_gematria(WORDS, 26, method)
+    # Raised when called, not only once the iterator is consumed.
+    with pytest.raises(ValueError):
+        iter_phrases_with_gematria(WORDS, 26, method)
+
+
+def test_invalid_max_words():
+    with pytest.raises(ValueError):
+        find_phrases_with_gematria(WORDS, 26, max_words=0)
+    with pytest.raises(ValueError):
+        iter_phrases_with_gematria(WORDS, 26, max_words=0)
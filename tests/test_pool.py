@@ -0,0 +1,74 @@
+import pytest
+
+from hebrew import FrozenHebrew, Hebrew
+from hebrew.pool import HebrewPool, PoolInfo
+from tests.test_hebrew import taamei_hamikra
+
+
+def test_pool_shares_instances():
+    pool = HebrewPool()
+    first = pool("שלום")
+    assert isinstance(first, FrozenHebrew)
+    assert pool("שלום") is first
+    assert pool("עולם") is not first
+    assert pool.cache_info() == PoolInfo(hits=1, misses=2, maxsize=65536, currsize=2)
+    assert len(pool) == 2
+    assert "שלום" in pool
+
+
+def test_pool_evicts_least_recently_used():
+    pool = HebrewPool(maxsize=2)
+    a = pool("א")
+    pool("ב")
+    assert pool("א") is a
+    pool("ג")
+    assert "ב" not in pool
+    assert "א" in pool
+    assert pool.cache_info() == PoolInfo(hits=1, misses=3, maxsize=2, currsize=2)
+
+
+def test_pool_sizes():
+    pool = HebrewPool(maxsize=0)
+    assert pool("א") is not pool("א")
+    assert pool.cache_info() == PoolInfo(hits=0, misses=2, maxsize=0, currsize=0)
+    pool = HebrewPool(maxsize=None)
+    for i in range(1000):
+        pool(str(i))
+    assert len(pool) == 1000
+    with pytest.raises(ValueError):
+        HebrewPool(maxsize=-1)
+
+
+def test_pool_clear():
+    pool = HebrewPool()
+    pool("א")
+    pool("א")
+    pool.clear()
+    assert pool.cache_info() == PoolInfo(hits=0, misses=0, maxsize=65536, currsize=0)
+
+
+@pytest.mark.parametrize("split_maqaf", [False, True])
+def test_words_with_pool(split_maqaf):
+    pool = HebrewPool()
+    text = " ".join(taamei_hamikra)
+    words = Hebrew(text).words(split_maqaf=split_maqaf, pool=pool)
+    assert words == Hebrew(text).words(split_maqaf=split_maqaf)
+    assert all(isinstance(w, FrozenHebrew) for w in words)
+    info = pool.cache_info()
+    assert info.hits + info.misses == len(words)
+    assert info.currsize == len(set(w.string for w in words))
+
+
+@pytest.mark.parametrize("maxsize", [65536, 0])
+def test_iter_words_with_pool(maxsize):
+    # A new pool is empty, so this checks that it is used even though it has no entries yet.
+    pool = HebrewPool(maxsize=maxsize)
+    words = list(Hebrew("א ב א").iter_words(pool=pool))
+    assert words == [Hebrew("א"), Hebrew("ב"), Hebrew("א")]
+    assert all(isinstance(w, FrozenHebrew) for w in words)
+    info = pool.cache_info()
+    assert info.hits + info.misses == 3
+    if maxsize:
+        assert words[0] is words[2]
+        assert info == PoolInfo(hits=1, misses=2, maxsize=maxsize, currsize=2)
+    assert list(Hebrew("א ב").iter_words(as_str=True, pool=pool)) == ["א", "ב"]
@@ -0,0 +1,56 @@
+import io
+
+import pytest
+
+from hebrew.cleaner import Cleaner
+from hebrew.chars import PASEQ
+from hebrew.stream import clean_file, clean_stream, iter_clean
+from tests.test_hebrew import taamei_hamikra
+
+CLEANERS = [
+    Cleaner(normalize=True),
+    Cleaner(no_maqaf=True, no_sof_passuk=True, no_taamim=True, no_niqqud=True),
+    Cleaner(text_only=True),
+]
+
+
+@pytest.mark.parametrize("cleaner", CLEANERS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1024 * 1024])
+@pytest.mark.parametrize("separator", ["\n", "\r\n", " "])
+def test_iter_clean_matches_cleaner(cleaner, chunk_size, separator):
+    text = separator.join(taamei_hamikra)
+    cleaned = "".join(iter_clean(io.StringIO(text), cleaner, chunk_size))
+    assert cleaned == cleaner(text)
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+def test_iter_clean_paseq_across_chunks(chunk_size):
+    text = f"אב {PASEQ.char} גד {PASEQ.char} הו"
+    cleaner = Cleaner(no_taamim=True)
+    assert "".join(iter_clean(io.StringIO(text), cleaner, chunk_size)) == "אב גד הו"
+
+
+def test_iter_clean_empty():
+    assert list(iter_clean(io.StringIO(""), Cleaner(normalize=True))) == []
+
+
+def test_iter_clean_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(iter_clean(io.StringIO("שלום"), Cleaner(), chunk_size=0))
+
+
+def test_clean_stream():
+    destination = io.StringIO()
+    cleaner = Cleaner(no_niqqud=True, no_taamim=True)
+    clean_stream(io.StringIO(taamei_hamikra[0]), destination, cleaner, chunk_size=5)
+    assert destination.getvalue() == cleaner(taamei_hamikra[0])
+
+
+def test_clean_file(tmp_path):
+    text = "\r\n".join(taamei_hamikra)
+    source = tmp_path / "source.txt"
+    destination = tmp_path / "destination.txt"
+    source.write_bytes(text.encode("utf-8"))
+    cleaner = Cleaner(normalize=True, no_taamim=True)
+    clean_file(source, destination, cleaner, chunk_size=10)
+    assert destination.read_bytes().decode("utf-8") == cleaner(text)
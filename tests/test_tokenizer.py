@@ -0,0 +1,56 @@
+import pytest
+
+from hebrew import FrozenHebrew, Hebrew
+from hebrew.chars import MAQAF, PASEQ, SOF_PASSUK
+from hebrew.tokenizer import SeparatorKind, Token, tokenize
+from tests.test_hebrew import taamei_hamikra
+
+
+def test_tokenize():
+    text = "וַיְהִי־עֶרֶב ׀ וַיְהִי־בֹקֶר יוֹם אֶחָד׃"
+    assert list(tokenize(text)) == [
+        Token(0, 7, "וַיְהִי", SeparatorKind.MAQAF),
+        Token(8, 13, "עֶרֶב", SeparatorKind.PASEQ),
+        Token(16, 23, "וַיְהִי", SeparatorKind.MAQAF),
+        Token(24, 29, "בֹקֶר", SeparatorKind.SPACE),
+        Token(30, 34, "יוֹם", SeparatorKind.SPACE),
+        Token(35, 40, "אֶחָד", SeparatorKind.SOF_PASSUK),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, separators",
+    [
+        ("", []),
+        ("   ", []),
+        ("א", [SeparatorKind.END]),
+        ("  א\t\n", [SeparatorKind.END]),
+        ("א ב", [SeparatorKind.SPACE, SeparatorKind.END]),
+        ("א׃ ב׃", [SeparatorKind.SOF_PASSUK, SeparatorKind.SOF_PASSUK]),
+        ("א־ב", [SeparatorKind.MAQAF, SeparatorKind.END]),
+        ("א׀ב", [SeparatorKind.PASEQ, SeparatorKind.END]),
+    ],
+)
+def test_tokenize_separators(text, separators):
+    assert [t.separator for t in tokenize(text)] == separators
+
+
+@pytest.mark.parametrize("pasuk", taamei_hamikra)
+def test_tokenize_matches_words(pasuk):
+    tokens = Hebrew(pasuk).tokenize()
+    words = Hebrew(pasuk).no_sof_passuk().words(split_maqaf=True)
+    assert [t.word for t in tokens] == [
+        w.string for w in words if w.string != PASEQ.char
+    ]
+    for token in tokens:
+        assert pasuk[token.start : token.end] == token.word
+        assert not set(token.word) & {MAQAF.char, PASEQ.char, SOF_PASSUK.char}
+    maqafs = [t for t in tokens if t.separator == SeparatorKind.MAQAF]
+    assert len(maqafs) == pasuk.count(MAQAF.char)
+
+
+def test_frozen_hebrew_tokenize():
+    hs = FrozenHebrew(taamei_hamikra[0])
+    tokens = hs.tokenize()
+    tokens.clear()
+    assert hs.tokenize() == Hebrew(taamei_hamikra[0]).tokenize()